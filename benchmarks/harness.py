@@ -0,0 +1,371 @@
+"""
+Harness that checks invariants that relate the tables of the data set to one
+another and that measures the latency of retrieving and decoding entries. For
+each supported combination of arity and coarity, every function (or a random
+sample of the functions) is retrieved from every table via
+:obj:`~circuitdb.circuitdb.circuitdb.__call__`, and the following invariants
+are checked:
+
+* every retrieved circuit computes the function that was requested,
+* no circuit for a function has fewer gates than the circuit from the
+  ``every`` table of minimal size, and no circuit for a function is shallower
+  than the circuit from the ``every`` table of minimal depth,
+* the circuit of minimal depth in a table is no deeper (with respect to the
+  counted gates) than the circuit of minimal size, and
+* each frontier starts with a circuit of minimal size and ends with a
+  circuit of minimal depth (with sizes increasing and depths decreasing).
+
+The work is distributed across a pool of processes. Each latency is the
+shortest of several repetitions, and it is divided by the latency of
+retrieving (or decoding) a fixed reference entry that is measured in the
+same way immediately afterwards (so that latencies are comparable across
+machines and runs regardless of the load on the machine). The results are compared against a
+baseline that is stored as a JSON file: a table is reported as a regression
+if its relative lookup or decoding latency exceeds that in the baseline by
+more than the tolerance (only if enough functions were measured for the
+median to be meaningful), or if the total number of gates or the total depth
+of its circuits exceeds the baseline total (the totals are compared only if
+the same functions were sampled). Invariant violations that are recorded in
+the baseline (*i.e.*, known defects of the data set) are not reported again.
+
+Run this module directly to report the results (the exit code is nonzero if
+any invariant does not hold or if any regression is found)::
+
+    python benchmarks/harness.py
+    python benchmarks/harness.py --samples 64 --seed 1 --workers 4
+    python benchmarks/harness.py --repeat 5 --minimum 64
+    python benchmarks/harness.py --update
+"""
+from __future__ import annotations
+from typing import Tuple, List, Dict, Optional, Callable
+import sys
+import os
+import json
+import time
+import random
+import statistics
+import argparse
+import concurrent.futures
+import logical
+from circuitdb import circuitdb
+from circuitdb.core import _name
+
+objectives: Tuple[str, ...] = ('size', 'depth', 'pareto')
+"""
+Objectives for which the tables are queried.
+"""
+
+baseline: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+"""
+Default location of the baseline against which results are compared.
+"""
+
+calibration: Tuple[int, int] = (0b00010111, 3)
+"""
+Packed truth table and arity of the reference entry (from the ``every`` table
+of minimal size) against which latencies are normalized.
+"""
+
+def timed(function: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    """
+    Invoke a function the specified number of times and return the shortest
+    time (in seconds) that an invocation took along with the result. The
+    shortest time is the one that is least affected by other activity on the
+    machine.
+    """
+    (best, result) = (float('inf'), None)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    return (best, result)
+
+def check( # pylint: disable=too-many-locals
+        arity: int,
+        coarity: int,
+        indices: List[int],
+        repeat: int = 3
+    ) -> Tuple[List[str], Dict[str, list]]:
+    """
+    Retrieve every supplied function from every table that has the supplied
+    arity and coarity. Return the descriptions of any invariants that do not
+    hold and, for each table, the lookup times, the decoding times (both in
+    seconds), the lookup and decoding times relative to those of the reference
+    entry, the total number of gates, and the total depth. Each time is the
+    shortest of the specified number of repetitions.
+    """
+    (violations, results) = ([], {})
+    tables = [
+        (operators, minimize)
+        for operators in circuitdb[arity][coarity]
+        for minimize in circuitdb[arity][coarity][operators]
+    ]
+
+    # Retrieve and decode an entry from each table once so that any work that
+    # is performed only on first use is not included in the measurements.
+    for (operators, minimize) in tables:
+        for objective in objectives:
+            vs = circuitdb(
+                indices[0], operators, minimize, objective,
+                view=True, arity=arity, coarity=coarity
+            )
+            for v in (vs if objective == 'pareto' else (vs,)):
+                v.to_circuit()
+
+    # The reference entry is measured immediately after every measured entry
+    # so that each relative latency reflects the conditions under which that
+    # entry was measured.
+    def reference() -> object:
+        return circuitdb(calibration[0], view=True, arity=calibration[1])
+
+    (_, r) = timed(reference, repeat)
+    for index in indices:
+        views = {}
+        for (operators, minimize) in tables:
+            for objective in objectives:
+                key = _name(arity, coarity, operators, minimize, objective)
+                result = results.setdefault(key, [[], [], [], [], 0, 0])
+
+                (lookup, vs) = timed(
+                    lambda i=index, o=operators, m=minimize, b=objective: circuitdb(
+                        i, o, m, b, view=True, arity=arity, coarity=coarity
+                    ),
+                    repeat
+                )
+                result[0].append(lookup)
+                result[2].append(lookup / timed(reference, repeat)[0])
+
+                vs = vs if objective == 'pareto' else (vs,)
+                for v in vs:
+                    (decode, c) = timed(v.to_circuit, repeat)
+                    result[1].append(decode)
+                    result[3].append(decode / timed(r.to_circuit, repeat)[0])
+
+                    if not circuitdb.equivalent(c, index):
+                        violations.append(key + ': circuit for ' + str(index) + ' is incorrect')
+
+                    result[4] += v.count()
+                    result[5] += v.depth()
+
+                views[(operators, minimize, objective)] = vs
+
+        violations.extend(invariants(arity, coarity, index, views))
+
+    return (violations, results)
+
+def invariants(arity: int, coarity: int, index: int, views: dict) -> List[str]:
+    """
+    Check the invariants that relate the circuits for a function from all the
+    tables that have the supplied arity and coarity to one another, and return
+    the descriptions of any that do not hold.
+    """
+    violations = []
+    every = logical.every
+    (smallest, shallowest) = (views[(every, every, 'size')][0], views[(every, every, 'depth')][0])
+    for ((operators, minimize, objective), vs) in views.items():
+        key = _name(arity, coarity, operators, minimize, objective) + ': ' + str(index) + ' '
+        if any(v.count() < smallest.count() for v in vs):
+            violations.append(key + 'has fewer gates than the smallest circuit')
+        if any(v.depth() < shallowest.depth() for v in vs):
+            violations.append(key + 'is shallower than the shallowest circuit')
+
+        if objective == 'pareto':
+            (size, depth) = (
+                views[(operators, minimize, 'size')][0],
+                views[(operators, minimize, 'depth')][0]
+            )
+            if depth.depth(minimize) > size.depth(minimize):
+                violations.append(key + 'has a shallowest circuit deeper than the smallest')
+            metrics = [(v.count(minimize), v.depth(minimize)) for v in vs]
+            if (
+                metrics[0][0] != size.count(minimize) or
+                metrics[-1][1] != depth.depth(minimize) or
+                any(m[0] > n[0] or m[1] <= n[1] for (m, n) in zip(metrics, metrics[1:]))
+            ):
+                violations.append(key + 'has an invalid frontier')
+
+    return violations
+
+def run( # pylint: disable=too-many-locals
+        samples: Optional[int] = None,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        repeat: int = 3
+    ) -> Tuple[List[str], Dict[str, dict]]:
+    """
+    Check every supported combination of arity and coarity in parallel using
+    all the functions (or the specified number of randomly sampled functions
+    for each combination). Return the descriptions of any invariants that do
+    not hold and the results for each table (consisting of the number of
+    functions that were retrieved, the median lookup and decoding latencies in
+    microseconds, the median lookup and decoding latencies relative to those of
+    the reference entry, the total number of gates, and the total depth).
+    Medians are reported because they are not affected by the occasional
+    preemption of the worker processes.
+    """
+    workers = workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+    tasks = []
+    for arity in sorted(circuitdb):
+        for coarity in sorted(circuitdb[arity]):
+            count = 2 ** ((2 ** arity) * coarity)
+            indices = (
+                list(range(count))
+                if samples is None or samples >= count else
+                sorted(rng.sample(range(count), samples))
+            )
+            tasks.extend((arity, coarity, indices[j::workers]) for j in range(workers))
+
+    (violations, totals) = ([], {})
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(check, *task, repeat)
+            for task in tasks if len(task[2]) > 0
+        ]
+        for future in futures:
+            (violations_, results) = future.result()
+            violations.extend(violations_)
+            for (key, result) in results.items():
+                total = totals.setdefault(key, [[], [], [], [], 0, 0])
+                for (j, value) in enumerate(result):
+                    total[j] += value
+
+    return (sorted(violations), {
+        key: {
+            'count': len(lookups),
+            'lookup_us': round(statistics.median(lookups) * 1e6, 3),
+            'decode_us': round(statistics.median(decodes) * 1e6, 3),
+            'lookup_rel': round(statistics.median(lookups_rel), 3),
+            'decode_rel': round(statistics.median(decodes_rel), 3),
+            'gates': gates,
+            'depth': depth
+        }
+        for (key, (lookups, decodes, lookups_rel, decodes_rel, gates, depth))
+        in sorted(totals.items())
+    })
+
+def regressions( # pylint: disable=too-many-arguments
+        results: Dict[str, dict],
+        reference: dict,
+        samples: Optional[int],
+        seed: int,
+        tolerance: float,
+        minimum: int
+    ) -> List[str]:
+    """
+    Compare the results for each table against the supplied baseline and return
+    the descriptions of any regressions. The latencies of a table are compared
+    (relative to those of the reference entry) only if at least the specified
+    minimum number of functions was retrieved from that table.
+    """
+    found = []
+    comparable = (reference.get('samples'), reference.get('seed')) == (samples, seed)
+    for (key, expected) in reference.get('tables', {}).items():
+        if key not in results:
+            found.append(key + ': table is missing')
+            continue
+
+        for metric in (('lookup_rel', 'decode_rel') if results[key]['count'] >= minimum else ()):
+            if metric in expected and results[key][metric] > expected[metric] * (1 + tolerance):
+                found.append(
+                    key + ': ' + metric + ' increased from ' +
+                    str(expected[metric]) + ' to ' + str(results[key][metric])
+                )
+
+        for metric in (('gates', 'depth') if comparable else ()):
+            if results[key][metric] > expected[metric]:
+                found.append(
+                    key + ': total ' + metric + ' increased from ' +
+                    str(expected[metric]) + ' to ' + str(results[key][metric])
+                )
+
+    return found
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Run the harness using the supplied command-line arguments, report the
+    results, and return the exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n', maxsplit=1)[0])
+    parser.add_argument(
+        '--samples', type=int, default=None,
+        help='number of functions to sample for each arity and coarity (default: all)'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='seed for sampling functions')
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='number of worker processes (default: number of processors)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of times each entry is retrieved and decoded (default: 3)'
+    )
+    parser.add_argument('--baseline', default=baseline, help='location of the baseline file')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.5,
+        help='permitted relative increase in latency (default: 0.5)'
+    )
+    parser.add_argument(
+        '--minimum', type=int, default=16,
+        help='number of functions a table needs for its latencies to be compared (default: 16)'
+    )
+    parser.add_argument(
+        '--update', action='store_true',
+        help='write the results to the baseline file instead of comparing them'
+    )
+    arguments = parser.parse_args(arguments)
+
+    (violations, results) = run(
+        arguments.samples, arguments.seed, arguments.workers, arguments.repeat
+    )
+    for (key, result) in results.items():
+        print(
+            key.ljust(40) +
+            format(result['lookup_us'], '.2f').rjust(10) + ' us/lookup' +
+            format(result['decode_us'], '.2f').rjust(10) + ' us/decode' +
+            format(result['lookup_rel'], '.2f').rjust(8) + 'x' +
+            format(result['decode_rel'], '.2f').rjust(8) + 'x'
+        )
+
+    if arguments.update:
+        for violation in violations:
+            print('invariant violated: ' + violation)
+        with open(arguments.baseline, 'w', encoding='utf-8') as file:
+            json.dump(
+                {
+                    'samples': arguments.samples,
+                    'seed': arguments.seed,
+                    'tables': results,
+                    'violations': violations
+                },
+                file, indent=2
+            )
+            file.write('\n')
+        return 0
+
+    reference = {}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline, encoding='utf-8') as file:
+            reference = json.load(file)
+
+    # Violations that are recorded in the baseline are known defects of the data
+    # set, so only other violations are reported.
+    known = set(reference.get('violations', []))
+    found = [violation for violation in violations if violation not in known]
+    for violation in found:
+        print('invariant violated: ' + violation)
+    if len(violations) > len(found):
+        print(str(len(violations) - len(found)) + ' known violation(s) recorded in the baseline')
+
+    regressions_ = regressions(
+        results, reference, arguments.samples, arguments.seed,
+        arguments.tolerance, arguments.minimum
+    )
+    for regression in regressions_:
+        print('regression: ' + regression)
+
+    return int(len(found) > 0 or len(regressions_) > 0)
+
+if __name__ == '__main__':
+    sys.exit(main())
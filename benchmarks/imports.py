@@ -0,0 +1,96 @@
+"""
+Benchmark of the cost of importing this library in a fresh interpreter. The
+dependency-free :obj:`circuitdb.core` module (which handles the tables, the
+reverse indices, and the individual records) is measured separately from the
+package (which adds the query interface) and from the first retrieval of a
+:obj:`~circuit.circuit.circuit` object (which imports the ``circuit`` and
+``logical`` libraries). The modules that each path loads are also checked, as
+only building a circuit should load any of the deferred modules.
+
+Run this module directly to report the results (the exit code is nonzero if
+the core path or the package loads any deferred module)::
+
+    python benchmarks/imports.py
+    python benchmarks/imports.py --repeat 20
+"""
+from __future__ import annotations
+from typing import Tuple, List, Dict, Optional
+import sys
+import json
+import argparse
+import subprocess
+
+paths: Dict[str, str] = {
+    'core': 'import circuitdb.core',
+    'package': 'import circuitdb',
+    'circuit': 'from circuitdb import circuitdb; circuitdb((0, 1, 1, 0))'
+}
+"""
+Statements that are timed for each path (in a fresh interpreter).
+"""
+
+deferred: Tuple[str, ...] = (
+    'circuit', 'logical', 'bitlist', 'doctest', 'base64',
+    'typing', 'hashlib', 'tempfile', 'importlib.metadata', 'importlib.resources'
+)
+"""
+Modules that should be loaded only once they are needed.
+"""
+
+def measure(statement: str) -> Tuple[float, List[str]]:
+    """
+    Execute a statement in a fresh interpreter and return the time it took (in
+    milliseconds) along with the deferred modules that were loaded as a result.
+    """
+    script = '; '.join([
+        'import sys, time, json',
+        'before = set(sys.modules)',
+        'start = time.perf_counter()',
+        statement,
+        'elapsed = time.perf_counter() - start',
+        'loaded = [m for m in ' + repr(deferred) + ' if m in sys.modules and m not in before]',
+        'print(json.dumps([elapsed * 1e3, loaded]))'
+    ])
+    output = subprocess.run(
+        [sys.executable, '-c', script],
+        check=True, capture_output=True, text=True
+    ).stdout
+    (milliseconds, loaded) = json.loads(output)
+    return (milliseconds, loaded)
+
+def benchmark(repeat: int = 10) -> Dict[str, Tuple[float, List[str]]]:
+    """
+    Return the best observed time (in milliseconds) for each path along with
+    the deferred modules that the path loads.
+    """
+    results = {}
+    for (name, statement) in paths.items():
+        measurements = [measure(statement) for _ in range(repeat)]
+        results[name] = (min(m for (m, _) in measurements), measurements[0][1])
+
+    return results
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark using the supplied command-line arguments, report the
+    results, and return the exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n', maxsplit=1)[0])
+    parser.add_argument(
+        '--repeat', type=int, default=10,
+        help='number of fresh interpreters in which each path is timed (default: 10)'
+    )
+    arguments = parser.parse_args(arguments)
+
+    failed = False
+    for (name, (milliseconds, loaded)) in benchmark(arguments.repeat).items():
+        print(
+            name.ljust(16) + format(milliseconds, '.2f').rjust(10) + ' ms' +
+            ('' if len(loaded) == 0 else '    loads ' + ', '.join(loaded))
+        )
+        failed = failed or (name != 'circuit' and len(loaded) > 0)
+
+    return int(failed)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Benchmark of the per-call overhead of retrieving entries from the data set
+for each of the supported truth table representations. The circuit data is
+retrieved as a :obj:`~circuitdb.core.circuitview` instance so that the
+overhead of building a :obj:`~circuit.circuit.circuit` object (which does not
+depend on the representation of the truth table) is excluded.
+
+Run this module directly to report the results::
+
+    python benchmarks/normalize.py
+"""
+import timeit
+import bitlist
+import logical
+from circuitdb import circuitdb
+
+representations = {
+    'tuple': ((0, 0, 1, 0, 0, 0, 0, 1), {}),
+    'tuple of booleans': ((False, False, True, False, False, False, False, True), {}),
+    'tuple of singleton tuples': (((0,), (0,), (1,), (0,), (0,), (0,), (0,), (1,)), {}),
+    'tuple of pairs': (((0, 1), (1, 0), (1, 0), (1, 1)), {}),
+    'logical': (logical.logical((0, 0, 1, 0, 0, 0, 0, 1)), {}),
+    'integer': (0b00100001, {'arity': 3}),
+    'bytes': (bytes([0, 0, 1, 0, 0, 0, 0, 1]), {}),
+    'bitlist': (bitlist.bitlist('00100001'), {})
+}
+"""
+Equivalent representations of truth tables that are retrieved in the benchmark.
+"""
+
+def benchmark(number: int = 20000, repeat: int = 5) -> dict:
+    """
+    Return the best observed time per call (in microseconds) for retrieving
+    an entry using each truth table representation.
+    """
+    return {
+        name: min(timeit.repeat(
+            lambda t=truthtable, kw=kwargs: circuitdb(t, view=True, **kw),
+            number=number,
+            repeat=repeat
+        )) / number * 1e6
+        for (name, (truthtable, kwargs)) in representations.items()
+    }
+
+if __name__ == '__main__':
+    for (name_, microseconds) in benchmark().items():
+        print(name_.ljust(32) + format(microseconds, '.2f').rjust(8) + ' us/call')
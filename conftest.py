@@ -0,0 +1,26 @@
+"""
+Configuration for the test run, which uses a temporary directory as the
+persistent cache of derived artifacts so that the tests neither depend on
+nor modify the cache of the user.
+"""
+import os
+import shutil
+import tempfile
+
+directory: list = []
+"""
+Temporary directory that is used as the cache for the duration of the run.
+"""
+
+def pytest_configure(config): # pylint: disable=unused-argument
+    """
+    Point the cache at a temporary directory before any module is imported.
+    """
+    directory.append(tempfile.mkdtemp(prefix='circuitdb-'))
+    os.environ['CIRCUITDB_CACHE'] = directory[0]
+
+def pytest_unconfigure(config): # pylint: disable=unused-argument
+    """
+    Remove the temporary directory that was used as the cache.
+    """
+    shutil.rmtree(directory.pop(), ignore_errors=True)
@@ -1,2 +1,3 @@
 """Gives users direct access to the class."""
-from circuitdb.circuitdb import circuitdb, record, records
+from circuitdb.core import record, circuitview, records, frontiers, reverseindex, cache
+from circuitdb.circuitdb import circuitdb
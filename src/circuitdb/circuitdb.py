@@ -1,370 +1,125 @@
 """
-Data set of optimal circuits for Boolean functions that have low arity.
+Data set of optimal circuits for Boolean functions that have low arity. This
+module provides the query interface for the data set, which retrieves circuits
+from the tables in the dependency-free :mod:`circuitdb.core` module and builds
+:obj:`~circuit.circuit.circuit` objects from them. The ``circuit`` and
+``logical`` libraries are imported only once a circuit is actually built (or
+an operator is retrieved from a gate), so retrieving records and inspecting
+their metrics does not require loading them.
 """
 from __future__ import annotations
-from typing import Tuple, Union, Optional, AbstractSet
-import doctest
-import importlib.resources
-import sys
 import os
-import math
-import base64
-import bitlist
-import logical
-import circuit
-
-class record(bytes):
-    """
-    Wrapper class for an individual record (*i.e.*, encoded data corresponding to a
-    circuit).
-    """
-    @staticmethod
-    def from_circuit(
-            circuit: circuit.circuit # pylint: disable=redefined-outer-name
-        ) -> record:
-        """
-        Encode a :obj:`~circuit.circuit.circuit` object and construct a record that
-        represents it.
-
-        >>> c = circuit.circuit()
-        >>> g0 = c.gate(logical.id_, is_input=True)
-        >>> g1 = c.gate(logical.id_, is_input=True)
-        >>> g2 = c.gate(logical.id_, is_input=True)
-        >>> g3 = c.gate(logical.xor_, [g0, g2])
-        >>> g4 = c.gate(logical.nimp_, [g1, g3])
-        >>> g5 = c.gate(logical.id_, [g4], is_output=True)
-        >>> record.from_circuit(c).to_base64()
-        'CQACBAEDBgQ='
-        """
-        # Create table for converting an encoded operator into an actual operator value.
-        integer_to_operator = list(sorted(list(logical.every)))
-
-        # Convert gate data into a list of integers. Note that the number of gates
-        # (including input and output gates) must not exceed 256.
-        bs = []
-        for g in circuit.gates:
-            if not g.is_input:
-                bs.extend(
-                    [integer_to_operator.index(g.operation)] +
-                    [circuit.gates.index(gi) for gi in g.inputs]
-                )
-
-        return record(bytes(bs))
-
-    @staticmethod
-    def from_base64(string: str) -> record:
-        """
-        Construct an instance from a Base64-encoded string representation of a record.
-
-        >>> record.from_base64('CQACBAEDBgQ=').hex()
-        '0900020401030604'
-        """
-        return record(base64.standard_b64decode(string))
-
-    def to_circuit(
-            self: record,
-            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
-        ) -> circuit.circuit:
-        """
-        Decode this record into a :obj:`~circuit.circuit.circuit` object.
-
-        >>> c = record.from_base64('CQACBAEDBgQ=').to_circuit((0, 0, 1, 0, 0, 0, 0, 1))
-        >>> c.gates.to_legible()
-        (('id',), ('id',), ('id',), ('xor', 0, 2), ('nimp', 1, 3), ('id', 4))
-        """
-        # Create table for converting an encoded operator into an actual operator value.
-        integer_to_operator = list(sorted(list(logical.every)))
-
-        # Parse the gate information from the encoded representation.
-        (j, ts) = (0, [])
-        while j < len(self):
-            operator = integer_to_operator[self[j]]
-            ts.append((operator, self[j + 1: j + 1 + operator.arity()]))
-            j += 1 + operator.arity()
-
-        # Build the circuit object programmatically.
-        arity = int(math.log2(len(truthtable)))
-        coarity = len(truthtable[0]) if isinstance(truthtable[0], tuple) else 1
-        c = circuit.circuit()
-        gs = []
-        for _ in range(arity): # Input gates.
-            gs.append(c.gate(logical.id_, [], is_input=True))
-        for entry in ts[0:-coarity]: # Internal gates.
-            gs.append(c.gate(entry[0], [gs[k] for k in entry[1]]))
-        for entry in ts[-coarity:]: # Output gates.
-            c.gate(entry[0], [gs[k] for k in entry[1]], is_output=True)
-
-        return c
-
-    def to_base64(self: record) -> str:
-        """
-        Convert this instance into a Base64-encoded string representation.
-
-        >>> c = circuit.circuit()
-        >>> g0 = c.gate(logical.id_, is_input=True)
-        >>> g1 = c.gate(logical.not_, [g0])
-        >>> g2 = c.gate(logical.id_, [g1], is_output=True)
-        >>> record.from_circuit(c).to_base64()
-        'DAAGAQ=='
-        """
-        return base64.standard_b64encode(self).decode('utf-8')
+import itertools
+from circuitdb.core import \
+    record, circuitview, records, frontiers, reverseindex, cache, \
+    _named, _every, _truthtable, _normalize, _derive, _name, _indices, _db
+
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Tuple, Union, Optional, AbstractSet, Iterable
+    import logical
+    import circuit
+
+_bitwise: dict = {
+    _named['nf']: lambda full: 0,
+    _named['nt']: lambda full: full,
+    _named['uf']: lambda full, x: 0,
+    _named['id']: lambda full, x: x,
+    _named['not']: lambda full, x: full ^ x,
+    _named['ut']: lambda full, x: full,
+    _named['bf']: lambda full, x, y: 0,
+    _named['and']: lambda full, x, y: x & y,
+    _named['nimp']: lambda full, x, y: x & ~y,
+    _named['fst']: lambda full, x, y: x,
+    _named['nif']: lambda full, x, y: y & ~x,
+    _named['snd']: lambda full, x, y: y,
+    _named['xor']: lambda full, x, y: x ^ y,
+    _named['or']: lambda full, x, y: x | y,
+    _named['nor']: lambda full, x, y: full ^ (x | y),
+    _named['xnor']: lambda full, x, y: full ^ x ^ y,
+    _named['nsnd']: lambda full, x, y: full ^ y,
+    _named['if']: lambda full, x, y: full ^ (y & ~x),
+    _named['nfst']: lambda full, x, y: full ^ x,
+    _named['imp']: lambda full, x, y: full ^ (x & ~y),
+    _named['nand']: lambda full, x, y: full ^ (x & y),
+    _named['bt']: lambda full, x, y: full
+}
+"""
+Private table of functions that apply each operator to bit vectors (all of which
+fit within the first argument) using the fewest bitwise operations.
+
+>>> import logical
+>>> from circuitdb.core import _apply
+>>> (masks, full) = ([0b0011, 0b0101], 0b1111)
+>>> all(
+...     _bitwise[o](full, *masks[:o.arity()]) == _apply(o, masks[:o.arity()], full)
+...     for o in logical.every
+... )
+True
+"""
 
-class records(list):
+def _simulate(
+        circuit: circuit.circuit, # pylint: disable=redefined-outer-name
+        words: int
+    ) -> Tuple[int, int, Iterable[Tuple[int, int, Tuple[int, ...]]]]:
     """
-    Wrapper class for a base-level operation-to-circuit map (corresponding to a fixed
-    combination of arity, coarity, operator set, and operator set to minimize).
+    Private function that evaluates a circuit on every input in a bit-sliced manner
+    (representing the values of a gate across many rows of the truth table using
+    the bits of an integer and evaluating each gate using bitwise operations).
+    The arity and coarity of the circuit are returned together with an iterable
+    of chunks of rows, where each chunk consists of at most the specified number
+    of 64-bit words per output. The offset of the first row in the chunk, the
+    number of rows, and the bit vectors of the outputs are yielded for each chunk.
+
+    >>> import circuit
+    >>> import logical
+    >>> c = circuit.circuit()
+    >>> g0 = c.gate(logical.id_, is_input=True)
+    >>> g1 = c.gate(logical.id_, is_input=True)
+    >>> g2 = c.gate(logical.xor_, [g0, g1])
+    >>> g3 = c.gate(logical.id_, [g2], is_output=True)
+    >>> (arity, coarity, chunks) = _simulate(c, 1)
+    >>> (arity, coarity, [(start, size, bin(masks[0])) for (start, size, masks) in chunks])
+    (2, 1, [(0, 4, '0b110')])
     """
-    @staticmethod
-    def from_file(resource: str) -> records:
-        """
-        Construct an instance from a binary file of circuit data (where the specified
-        resource is either a package resource of this package or a file path).
-
-        >>> len(records.from_file('3_1_every_every'))
-        256
-        """
-        if os.path.exists(resource):
-            with open(resource, 'rb') as file:
-                data = file.read()
+    gates = list(circuit.gates)
+    inputs = [ # Nullary operators are the only ones with one-entry truth tables.
+        g for g in gates if len(g.inputs) == 0 and len(g.operation) > 1
+    ]
+    outputs = [g for g in gates if len(g.outputs) == 0 and g.is_output]
+    arity = len(inputs)
+    size = min(2 ** arity, 64 * words)
+    full = (1 << size) - 1
+
+    # The bit vector of an input that alternates within each chunk is the same
+    # for every chunk (and the bit vector of any other input is constant).
+    patterns = []
+    for i in range(arity):
+        period = 2 ** (arity - i)
+        if period <= size:
+            (pattern, width) = ((1 << (period // 2)) - 1, period)
+            while width < size:
+                (pattern, width) = (pattern | (pattern << width), width * 2)
+            patterns.append(pattern)
         else:
-            # Support Python version 3.7 and above.
-            if sys.version_info.minor >= 9: # pragma: no cover
-                # Available in Python version 3.9 and above.
-                with { # pylint: disable=no-member
-                    r.name: r
-                    for r in importlib.resources.files('circuitdb').iterdir()
-                }[resource].open('rb') as file:
-                    data = file.read()
-            else: # pragma: no cover
-                # Not deprecated in Python version 3.10 and below.
-                data = importlib.resources.read_binary('circuitdb', resource)
-
-        return records([
-            bytes([b - 1 for b in bs])
-            for bs in data.split(bytes([0]))
-        ])
-
-    def to_file(self: records, path: str):
-        """
-        Write the data in this instance to a binary file.
-
-        >>> rs = records.from_file('3_1_every_every')
-        >>> rs.to_file('test-output-records.to_file')
-        >>> len(records.from_file('test-output-records.to_file'))
-        256
-        >>> os.remove('test-output-records.to_file')
-        """
-        bs = []
-        for (j, r) in enumerate(self):
-            bs.extend(
-                [b + 1 for b in record(r)] +
-                ([] if j == len(self) - 1 else [0])
-            )
-        with open(path, 'wb') as file:
-            file.write(bytes(bs))
-
-    def __getitem__(
-            self: records,
-            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
-        ) -> record:
-        """
-        Data retrieval wrapper that performs normalization of the truth table,
-        but does not check that it has a correct structure. To ensure the supplied
-        truth table representation is valid, the :obj:`circuitdb.__call__` should
-        be used to retrieve circuit data.
-        """
-        # Normalize the truth table representation (no validation) and
-        # convert it into an index into the data.
-        if all(isinstance(e, tuple) for e in truthtable):
-            truthtable = tuple(tuple(map(int, e)) for e in truthtable)
-            ls = set(len(e) for e in truthtable)
-            if len(ls) == 1 and list(ls)[0] == 1:
-                truthtable = list(e[0] for e in truthtable)
-                index = int(bitlist.bitlist(truthtable))
-            else:
-                index = int(bitlist.bitlist([b for t in truthtable for b in t]))
-        else:
-            truthtable = list(map(int, truthtable))
-            index = int(bitlist.bitlist(truthtable))
+            patterns.append(None)
+
+    def chunks():
+        for start in range(0, 2 ** arity, size):
+            wire = {}
+            for (i, g) in enumerate(inputs):
+                wire[g] = (
+                    patterns[i]
+                    if patterns[i] is not None else
+                    (full if (start >> (arity - 1 - i)) & 1 else 0)
+                )
+            for g in gates:
+                if g not in wire:
+                    wire[g] = _bitwise[g.operation](full, *[wire[gi] for gi in g.inputs])
 
-        # Retrieve, decode, and return the circuit data.
-        return record(super().__getitem__(index)).to_circuit(truthtable)
+            yield (start, size, tuple(wire[g] for g in outputs))
 
-_db: dict = {}
-"""
-Private dictionary object that represents the data set.
-"""
-
-# Set up containers for each (arity, coarity, operator set) combination
-# for which data is included.
-for i in range(0, 4):
-    _db[i] = {}
-
-    if i == 0:
-        _db[i][1] = {
-            logical.every: {}
-        }
-
-    if i in range(1, 4):
-        _db[i][1] = {
-            frozenset({logical.id_, logical.not_, logical.and_, logical.or_}): {},
-            frozenset({logical.id_, logical.not_, logical.and_, logical.xor_}): {},
-            logical.every: {}
-        }
-
-    if i == 2:
-        _db[i][2] = {
-            frozenset({logical.id_, logical.not_, logical.and_, logical.or_}): {},
-            frozenset({logical.id_, logical.not_, logical.and_, logical.xor_}): {},
-            logical.every: {}
-        }
-
-_db \
-    [1][1] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    = records(map(base64.standard_b64decode, [
-        'DAADAAEGAg==',
-        'BgA=',
-        'DAAGAQ==',
-        'DAAKAAEGAg==',
-    ]))
-
-_db \
-    [2][1] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    = records(map(base64.standard_b64decode, [
-        'DAADAAIGAw==',
-        'AwABBgI=',
-        'DAEDAAIGAw==',
-        'BgA=',
-        'DAADAQIGAw==',
-        'BgE=',
-        'AwABDAIKAAEDAwQGBQ==',
-        'CgABBgI=',
-        'CgABDAIGAw==',
-        'AwABCgABDAMKAgQGBQ==',
-        'DAEGAg==',
-        'DAEKAAIGAw==',
-        'DAAGAg==',
-        'DAAKAQIGAw==',
-        'AwABDAIGAw==',
-        'DAAKAAIGAw==',
-    ]))
-
-_db \
-    [2][2] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    = records.from_file('2_2_id-not-and-or_id-not-and-or')
-
-_db \
-    [3][1] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.or_})] \
-    = records.from_file('3_1_id-not-and-or_id-not-and-or')
-
-_db \
-    [1][1] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.xor_})] \
-    [frozenset({logical.and_})] \
-    = records(map(base64.standard_b64decode, [
-        'DAAMAAkBAgYD',
-        'BgA=',
-        'DAAGAQ==',
-        'DAAJAAEGAg==',
-    ]))
-
-_db \
-    [2][1] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.xor_})] \
-    [frozenset({logical.and_})] \
-    = records(map(base64.standard_b64decode, [
-        'DAAMAAkCAwYE',
-        'AwABBgI=',
-        'DAEDAAIGAw==',
-        'BgA=',
-        'DAADAQIGAw==',
-        'BgE=',
-        'CQABBgI=',
-        'DAADAQIJAAMGBA==',
-        'DAAMAQMCAwYE',
-        'DAAJAQIGAw==',
-        'DAEGAg==',
-        'DAADAQIMAwYE',
-        'DAAGAg==',
-        'DAADAAEJAgMGBA==',
-        'AwABDAIGAw==',
-        'DAAJAAIGAw==',
-    ]))
-
-_db \
-    [2][2] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.xor_})] \
-    [frozenset({logical.and_})] \
-    = records.from_file('2_2_id-not-and-xor_and')
-
-_db \
-    [3][1] \
-    [frozenset({logical.id_, logical.not_, logical.and_, logical.xor_})] \
-    [frozenset({logical.and_})] \
-    = records.from_file('3_1_id-not-and-xor_and')
-
-_db \
-    [0][1] \
-    [logical.every] \
-    [logical.every] \
-    = records(map(base64.standard_b64decode, [
-        'AAYA',
-        'CwYA',
-    ]))
-
-_db \
-    [1][1] \
-    [logical.every] \
-    [logical.every] \
-    = records(map(base64.standard_b64decode, [
-        'AQAGAQ==',
-        'BgA=',
-        'DAAGAQ==',
-        'EQAGAQ==',
-    ]))
-
-_db \
-    [2][1] \
-    [logical.every] \
-    [logical.every] \
-    = records(map(base64.standard_b64decode, [
-        'AgABBgI=',
-        'AwABBgI=',
-        'BAABBgI=',
-        'BQABBgI=',
-        'BwABBgI=',
-        'CAABBgI=',
-        'CQABBgI=',
-        'CgABBgI=',
-        'DQABBgI=',
-        'DgABBgI=',
-        'DwABBgI=',
-        'EAABBgI=',
-        'EgABBgI=',
-        'EwABBgI=',
-        'FAABBgI=',
-        'FQABBgI=',
-    ]))
-
-_db \
-    [2][2] \
-    [logical.every] \
-    [logical.every] \
-    = records.from_file('2_2_every_every')
-
-_db \
-    [3][1] \
-    [logical.every] \
-    [logical.every] \
-    = records.from_file('3_1_every_every')
+    return (arity, len(outputs), chunks())
 
 class circuitdb(dict):
     """
@@ -486,6 +241,37 @@ class circuitdb(dict):
     ('and', 1, 4)
     ('id', 5)
 
+    **Objective:** By default, the retrieved circuit is a smallest circuit for
+    the function (*i.e.*, the objective is ``'size'``). The database also contains
+    an example of a circuit of minimal depth for every function (where the depth
+    of a circuit is the largest number of gates that must be counted according to
+    the ``minimize`` parameter along any path from an input to an output). Among
+    the circuits of minimal depth for a function, the database favors smaller
+    circuits, but these are not guaranteed to be the smallest possible ones.
+
+    >>> ops = {logical.id_, logical.not_, logical.and_, logical.or_}
+    >>> for g in circuitdb((0, 0, 1, 0, 1, 0, 0, 0), ops, objective='depth').gates.to_legible():
+    ...     print(g)
+    ('id',)
+    ('id',)
+    ('id',)
+    ('and', 0, 1)
+    ('or', 0, 1)
+    ('not', 2)
+    ('not', 3)
+    ('and', 4, 5)
+    ('and', 6, 7)
+    ('id', 8)
+
+    All the circuits that represent different trade-offs between size and depth
+    (*i.e.*, the Pareto frontier of the circuits in the database for a function
+    with respect to these two metrics) can be retrieved in a single query, ordered
+    from the smallest circuit to the shallowest circuit.
+
+    >>> vs = circuitdb((0, 0, 1, 0, 1, 0, 0, 0), ops, objective='pareto', view=True)
+    >>> [(v.count(), v.depth()) for v in vs]
+    [(5, 4), (6, 3)]
+
     **Supported Combinations:** Each logical function has a number of input values,
     a number of output values, a set of permitted gates/**operators**, and a set of
     gates to **minimize** in quantity. Entries exist in the database for only a finite
@@ -524,44 +310,75 @@ class circuitdb(dict):
     | 3          | 1           | ``every``                   | ``every``                  |
     +------------+-------------+-----------------------------+----------------------------+
 
+    Every combination in the table above is available for each of the objectives
+    ``'size'``, ``'depth'``, and ``'pareto'``.
+
+    **Derived Tables:** Circuits for other sets of operators (that can be used to
+    implement every function) are derived from the circuits in the database by
+    the :mod:`~circuitdb.translate` module when they are first requested. Derived
+    circuits are *not* guaranteed to be optimal, which is indicated by the
+    ``optimal`` attribute of views of these circuits.
+
+    >>> nand = {logical.nand_}
+    >>> v = circuitdb((0, 1, 1, 0), nand, view=True)
+    >>> v.to_legible()
+    (('id',), ('id',), ('nand', 0, 1), ('nand', 0, 2), ('nand', 1, 2), ('nand', 3, 4), ('id', 5))
+    >>> v.optimal
+    False
+    >>> circuitdb((0, 1, 1, 0), nand, objective='depth').gates.to_legible()
+    (('id',), ('id',), ('nand', 0, 1), ('nand', 0, 2), ('nand', 1, 2), ('nand', 3, 4), ('id', 5))
+
     The database supports retrieval using index notation, as well.
 
     >>> ops = logical.every
-    >>> circuitdb[1][1][ops][ops][(0, 0)].gates.to_legible()
+    >>> circuitdb[1][1][ops][ops]['size'][(0, 0)].gates.to_legible()
     (('id',), ('uf', 0), ('id', 1))
-    >>> circuitdb[1][1][ops][ops][((0,), (0,))].gates.to_legible()
+    >>> circuitdb[1][1][ops][ops]['size'][((0,), (0,))].gates.to_legible()
     (('id',), ('uf', 0), ('id', 1))
 
     The top-level database instance has keys that represent to the number of
     inputs of the logical function. The second level down, the keys represent
     the number of outputs of a logical function. The third level down, keys
     represent the set of unary or binary gates to which circuits are restricted.
-    Finally, the last level down, the keys represent logical functions.
+    The fourth level down, keys represent the set of gates that are counted, and
+    the fifth level down, keys represent the objective. Finally, the last level
+    down, the keys represent logical functions.
 
     >>> list(sorted(list(circuitdb.keys()))) == [0, 1, 2, 3]
     True
     >>> ks = list(sorted(list(circuitdb[1][1].keys())))
     >>> ks[0] == frozenset({logical.and_, logical.or_, logical.not_, logical.id_})
     True
-    >>> circuitdb[2][1][ks[0]][ks[0]][(1,1,1,1)].gates.to_legible()
+    >>> circuitdb[2][1][ks[0]][ks[0]]['size'][(1,1,1,1)].gates.to_legible()
     (('id',), ('id',), ('not', 0), ('or', 0, 2), ('id', 3))
+    >>> list(circuitdb[2][1][ks[0]][ks[0]].keys())
+    ['size', 'depth', 'pareto']
+    >>> len(circuitdb[2][1][ks[0]][ks[0]]['pareto'][(0, 1, 1, 0)])
+    1
 
     Note that the internal representation organizes the circuits by arity.
 
     >>> _d = {i: _db[i][1] for i in range(1,4)}
-    >>> all(len(_d[1][o][m]) == 4 for o in _d[1] for m in _d[1][o])
+    >>> all(len(_d[1][o][m][g]) == 4 for o in _d[1] for m in _d[1][o] for g in _d[1][o][m])
     True
-    >>> all(len(_d[2][o][m]) == 16 for o in _d[2] for m in _d[2][o])
+    >>> all(len(_d[2][o][m][g]) == 16 for o in _d[2] for m in _d[2][o] for g in _d[2][o][m])
     True
-    >>> all(len(_d[3][o][m]) == 256 for o in _d[3] for m in _d[3][o])
+    >>> all(len(_d[3][o][m][g]) == 256 for o in _d[3] for m in _d[3][o] for g in _d[3][o][m])
     True
     """
-    def __call__(
+    def __call__( # pylint: disable=too-many-arguments
         self: circuitdb,
         truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]],
         operators: Optional[AbstractSet[logical.logical]] = None,
-        minimize: Optional[AbstractSet[logical.logical]] = None
-    ) -> circuit.circuit:
+        minimize: Optional[AbstractSet[logical.logical]] = None,
+        objective: str = 'size',
+        view: bool = False,
+        arity: Optional[int] = None,
+        coarity: Optional[int] = None
+    ) -> Union[
+        circuit.circuit, circuitview,
+        Tuple[circuit.circuit, ...], Tuple[circuitview, ...]
+    ]:
         """
         Function-like interface for the circuit database, with user-friendly
         defaults for retrieving circuit data.
@@ -584,6 +401,28 @@ class circuitdb(dict):
         >>> circuitdb(((1, 0), (1, 0), (1, 0), (0, 1))).gates.to_legible()
         (('id',), ('id',), ('and', 0, 1), ('not', 2), ('id', 3), ('id', 2))
 
+        More compact representations of a logical function are also supported:
+        the integer that corresponds to the bits of the truth table (in which case
+        the arity must be specified), a bytes-like object in which each byte is
+        ``0`` or ``1``, a :obj:`~bitlist.bitlist.bitlist` instance, or an instance
+        of :obj:`~logical.logical.logical`. The coarity of such a representation
+        is one unless it is specified.
+
+        >>> circuitdb(0b00000001, arity=3).gates.to_legible()
+        (('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))
+        >>> circuitdb(bytes([0, 0, 0, 0, 0, 0, 0, 1])).gates.to_legible()
+        (('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))
+        >>> import bitlist
+        >>> import logical
+        >>> circuitdb(bitlist.bitlist('00000001')).gates.to_legible()
+        (('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))
+        >>> circuitdb(logical.and_).gates.to_legible()
+        (('id',), ('id',), ('and', 0, 1), ('id', 2))
+        >>> circuitdb(0b10101001, arity=2, coarity=2).gates.to_legible()
+        (('id',), ('id',), ('and', 0, 1), ('not', 2), ('id', 3), ('id', 2))
+        >>> circuitdb(bytes([1, 0, 1, 0, 1, 0, 0, 1]), coarity=2).gates.to_legible()
+        (('id',), ('id',), ('and', 0, 1), ('not', 2), ('id', 3), ('id', 2))
+
         It is also possible to retrieve a smallest circuit that only uses gates
         from a specific set of gates.
 
@@ -593,13 +432,37 @@ class circuitdb(dict):
         ... ).gates.to_legible()
         (('id',), ('id',), ('id',), ('not', 0), ('and', 0, 3), ('id', 4))
 
+        If only the gates of a circuit are of interest, a lightweight read-only
+        :obj:`~circuitdb.core.circuitview` instance can be retrieved instead
+        (from which the corresponding :obj:`~circuit.circuit.circuit` object can
+        still be built on demand).
+
+        >>> v = circuitdb((0, 0, 0, 0, 0, 0, 0, 1), view=True)
+        >>> v.to_legible()
+        (('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))
+        >>> v.to_circuit().gates.to_legible()
+        (('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))
+
+        A circuit of minimal depth can be retrieved by specifying the objective.
+        If the objective is ``'pareto'``, a tuple of circuits (or of views) that
+        represent different trade-offs between size and depth is returned.
+
+        >>> circuitdb((0, 1, 1, 0, 1, 0, 0, 1), objective='depth').gates.to_legible()
+        (('id',), ('id',), ('id',), ('xor', 0, 1), ('xor', 2, 3), ('id', 4))
+        >>> ops = {logical.id_, logical.not_, logical.and_, logical.or_}
+        >>> vs = circuitdb((0, 0, 1, 0, 1, 0, 0, 0), ops, objective='pareto', view=True)
+        >>> [v.count() for v in vs]
+        [5, 6]
+        >>> [c.gates.to_legible() for c in circuitdb((0, 1, 1, 0), objective='pareto')]
+        [(('id',), ('id',), ('xor', 0, 1), ('id', 2))]
+
         Any attempt to access the data with a malformed key raises an
         exception.
 
         >>> circuitdb([0, 0, 0, 0])
         Traceback (most recent call last):
           ...
-        TypeError: truth table must be a tuple
+        TypeError: truth table must be a tuple, an integer, a bytes-like object, or a bit list
         >>> circuitdb((0, 0, 0))
         Traceback (most recent call last):
           ...
@@ -624,10 +487,40 @@ class circuitdb(dict):
         Traceback (most recent call last):
           ...
         ValueError: truth table entries must all have the same length
+        >>> circuitdb((1.0, 0.0)).gates.to_legible()
+        (('id',), ('not', 0), ('id', 1))
+        >>> circuitdb(bytes([0, 2]))
+        Traceback (most recent call last):
+          ...
+        TypeError: truth table must contain boolean values, integers in the range ... of such
+        >>> circuitdb(bytes([0, 1, 0]))
+        Traceback (most recent call last):
+          ...
+        ValueError: truth table must have a length that is a power of two
+        >>> circuitdb(1)
+        Traceback (most recent call last):
+          ...
+        ValueError: arity must be specified for a truth table that is an integer
+        >>> circuitdb(16, arity=2)
+        Traceback (most recent call last):
+          ...
+        ValueError: truth table integer is out of range for the specified arity
+        >>> circuitdb(bytes([0, 1]), coarity=0)
+        Traceback (most recent call last):
+          ...
+        ValueError: coarity must be a positive integer
+        >>> circuitdb((0, 1), arity=2)
+        Traceback (most recent call last):
+          ...
+        ValueError: truth table does not have the specified arity and coarity
         >>> circuitdb((0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0))
         Traceback (most recent call last):
           ...
         ValueError: no entries for functions of arity 4
+        >>> circuitdb(1, arity=40)
+        Traceback (most recent call last):
+          ...
+        ValueError: no entries for functions of arity 40
         >>> circuitdb(((0,0,0), (1,1,1)))
         Traceback (most recent call last):
           ...
@@ -661,66 +554,79 @@ class circuitdb(dict):
         Traceback (most recent call last):
           ...
         ValueError: no entries for functions of arity 3 for specified operators ... criteria
+        >>> circuitdb((0, 0, 0, 0, 0, 0, 0, 0), objective='area')
+        Traceback (most recent call last):
+          ...
+        ValueError: objective must be 'size', 'depth', or 'pareto'
 
         Additional exhaustive tests are presented below.
 
         >>> from itertools import product
         >>> evals = lambda c, a: tuple([c.evaluate(v)[0] for v in product(*[[0, 1]]*a)])
         >>> _d = {i: _db[i][1] for i in range(1,4)}
-        >>> aoms = [(a, o, m) for a in _d for o in _d[a] for m in _d[a][o]]
+        >>> aoms = [(a, o, m, g) for a in _d for o in _d[a] for m in _d[a][o] for g in _d[a][o][m]]
+        >>> cs = lambda t, o, m, g: (
+        ...     circuitdb(t, o, m, g) if g == 'pareto' else (circuitdb(t, o, m, g),)
+        ... )
         >>> all(
-        ...     all(t == evals(circuitdb(t, o, m), a) for t in product(*[[0, 1]]*(2**a)))
-        ...     for (a, o, m) in aoms
+        ...     all(t == evals(c, a) for t in product(*[[0, 1]]*(2**a)) for c in cs(t, o, m, g))
+        ...     for (a, o, m, g) in aoms
         ... )
         True
         >>> evals = lambda c, a: tuple([tuple(c.evaluate(v)) for v in product(*[[0, 1]]*a)])
         >>> aoms = [(a, o, m) for a in [2] for o in _db[a][2] for m in _db[a][2][o]]
         >>> pairs = [(0, 0), (0, 1), (1, 0), (0, 1)]
         >>> all(
-        ...     all(t == evals(circuitdb(t, o, m), a) for t in product(*[pairs]*(2**a)))
+        ...     all(
+        ...         t == evals(circuitdb(t, o, m, g), a)
+        ...         for t in product(*[pairs]*(2**a)) for g in ['size', 'depth']
+        ...     )
         ...     for (a, o, m) in aoms
         ... )
         True
+
+        The depth of each circuit of minimal depth never exceeds that of the
+        corresponding smallest circuit.
+
+        >>> all(
+        ...     circuitdb(t, o, m, 'depth', True).depth(m) <= circuitdb(t, o, m, view=True).depth(m)
+        ...     for a in _d for o in _d[a] for m in _d[a][o] for t in product(*[[0, 1]]*(2**a))
+        ... )
+        True
         """
-        # pylint: disable=too-many-branches
-
-        # Ensure the function truth table is a tuple.
-        if not isinstance(truthtable, tuple):
-            raise TypeError('truth table must be a tuple')
-
-        # Ensure that the function truth table has valid entry types.
-        if all(isinstance(e, tuple) for e in truthtable):
-            if not all(all(b in (0, 1, False, True) for b in e) for e in truthtable):
-                raise TypeError(
-                    'truth table must contain boolean values, integers in the ' +
-                    'range [0, 1], or tuples of such'
-                )
-        elif not all(e in (0, 1, False, True) for e in truthtable):
-            raise TypeError(
-                'truth table must contain boolean values, integers in the ' +
-                'range [0, 1], or tuples of such'
+        # Validate and normalize the truth table in a single pass.
+        (index, arity, coarity) = _normalize(truthtable, arity, coarity)
+
+        # The data is accessed directly (rather than via the bracket notation that
+        # is overloaded in the :obj:`records.__getitem__` method) because the truth
+        # table has already been normalized.
+        (arity, coarity, operators, minimize, objective) = self._key(
+            arity, coarity, operators, minimize, objective
+        )
+        table = self._table((arity, coarity, operators, minimize, objective))
+        if objective == 'pareto':
+            vs = tuple(
+                circuitview(bs, arity, coarity, table.optimal)
+                for bs in table.entry(index)
             )
+            return vs if view else tuple(v.to_circuit() for v in vs)
 
-        # Determine the arity of the function represented by the truth table.
-        arity = int(math.log2(len(truthtable)))
-
-        # Check that the number of entries in the truth table is a power of two.
-        if len(truthtable) < 1 or 2**arity != len(truthtable):
-            raise ValueError('truth table must have a length that is a power of two')
-
-        # Determine the number of outputs in the truth table (and check it is consistent).
-        coarity = 1
-        if all(isinstance(e, tuple) for e in truthtable):
-            ls = set(len(e) for e in truthtable)
-            if len(ls) == 1:
-                coarity = list(ls)[0]
-                if coarity < 1:
-                    raise ValueError('truth table entries must each represent at least one value')
-                if coarity == 1: # Convert tuple of singleton tuples into simple tuple.
-                    truthtable = tuple(e[0] for e in truthtable)
-            else:
-                raise ValueError('truth table entries must all have the same length')
+        v = circuitview(list.__getitem__(table, index), arity, coarity, table.optimal)
+        return v if view else v.to_circuit()
 
+    @staticmethod
+    def _key(
+        arity: int,
+        coarity: int,
+        operators: Optional[AbstractSet[logical.logical]],
+        minimize: Optional[AbstractSet[logical.logical]],
+        objective: str = 'size'
+    ) -> Tuple[int, int, frozenset, frozenset, str]:
+        """
+        Check that data exists for the supplied combination of arity, coarity,
+        operator set, operator set to minimize, and objective (substituting
+        defaults where necessary), and return the normalized key for that data.
+        """
         # Ensure that data for functions of the requested arity and coarity is available.
         if arity not in _db:
             raise ValueError('no entries for functions of arity ' + str(arity))
@@ -731,29 +637,25 @@ class circuitdb(dict):
                 'having output vectors of length ' + str(arity)
             )
 
-        # Normalize the truth table representation.
-        if coarity == 1:
-            truthtable = tuple(map(int, truthtable))
-        else:
-            truthtable = tuple(tuple(map(int, e)) for e in truthtable)
-
         # Allow all operators by default or check that data is present for given operators.
-        operators = logical.every if operators is None else operators
+        operators = _every if operators is None else operators
 
         if not isinstance(operators, (set, frozenset)):
             raise TypeError('collection of operators must be a set or frozenset')
 
-        if not operators.issubset(logical.every):
+        if not operators.issubset(_every):
             raise ValueError('collection of operators must only contain valid operators')
 
-        if frozenset(operators) not in _db[arity][1]:
-            raise ValueError(
-                'no entries for functions of arity ' + str(arity) + ' ' +
-                'that have only the specified operators'
-            )
+        # Tables are derived for operator sets that are not included in the data
+        # set (in which case all operators are minimized by default).
+        derived = frozenset(operators) not in _db[arity][1]
 
         # Minimize the total number of operators of any available kind by default.
-        minimize_ = list(sorted(list(_db[arity][1][frozenset(operators)].keys())))[0]
+        minimize_ = (
+            frozenset(operators)
+            if derived else
+            list(sorted(list(_db[arity][1][frozenset(operators)].keys())))[0]
+        )
         minimize = minimize_ if minimize is None else minimize
 
         # Check that the operators to minimize are valid and corresponding data exists.
@@ -763,21 +665,304 @@ class circuitdb(dict):
                 'must be a set or frozenset'
             )
 
-        if not minimize.issubset(logical.every):
+        if not minimize.issubset(_every):
             raise ValueError(
                 'collection of operators the number of which to minimize ' +
                 'must contain only valid operators'
             )
 
-        if frozenset(minimize) not in _db[arity][1][frozenset(operators)]:
+        if not derived and frozenset(minimize) not in _db[arity][1][frozenset(operators)]:
             raise ValueError(
                 'no entries for functions of arity ' + str(arity) + ' ' +
                 'for specified operators and minimization criteria'
             )
 
-        # The bracket notation below is overloaded in the :obj:`records.__getitem__` method,
-        # so there is no risk of users modifying the data.
-        return _db[arity][coarity][frozenset(operators)][frozenset(minimize)][truthtable]
+        if objective not in ('size', 'depth', 'pareto'):
+            raise ValueError("objective must be 'size', 'depth', or 'pareto'")
+
+        if derived:
+            try:
+                _derive(arity, coarity, operators, minimize)
+            except ValueError:
+                raise ValueError(
+                    'no entries for functions of arity ' + str(arity) + ' ' +
+                    'that have only the specified operators'
+                ) from None
+
+        return (arity, coarity, frozenset(operators), frozenset(minimize), objective)
+
+    @staticmethod
+    def _table(key: Tuple[int, int, frozenset, frozenset, str]) -> Union[records, frontiers]:
+        """
+        Retrieve the table of circuits (either included in the data set or derived)
+        for a normalized key.
+        """
+        (arity, coarity, operators, minimize, objective) = key
+        if operators in _db[arity][coarity]:
+            return _db[arity][coarity][operators][minimize][objective]
+
+        return _derive(arity, coarity, operators, minimize)[objective]
+
+    def index( # pylint: disable=too-many-arguments
+            self: circuitdb,
+            arity: int,
+            coarity: int = 1,
+            operators: Optional[AbstractSet[logical.logical]] = None,
+            minimize: Optional[AbstractSet[logical.logical]] = None,
+            objective: str = 'size'
+        ) -> reverseindex:
+        """
+        Retrieve the :obj:`~circuitdb.core.reverseindex` instance for the circuits
+        that have the supplied arity and coarity, that are constructed using the
+        supplied operators, and that are optimized for the supplied objective (with
+        the same defaults as :obj:`__call__`). Each reverse index is built the first
+        time it is requested.
+
+        >>> len(circuitdb.index(3).indices(depth=2))
+        212
+        >>> import logical
+        >>> ri = circuitdb.index(
+        ...     3, 1,
+        ...     {logical.id_, logical.not_, logical.and_, logical.xor_}, {logical.and_}
+        ... )
+        >>> len(ri.indices(operators={logical.and_: 1}))
+        128
+        >>> len(circuitdb.index(3, objective='depth').indices(depth=2))
+        232
+
+        >>> circuitdb.index(3, objective='pareto')
+        Traceback (most recent call last):
+          ...
+        ValueError: reverse indices are only available for the 'size' and 'depth' objectives
+        >>> ri is circuitdb.index(
+        ...     3, 1,
+        ...     frozenset({logical.id_, logical.not_, logical.and_, logical.xor_}),
+        ...     frozenset({logical.and_})
+        ... )
+        True
+
+        The number of gates and the depth of each circuit are measured with
+        respect to the operators that are minimized in its table.
+
+        >>> ri = circuitdb.index(
+        ...     3, 1,
+        ...     {logical.id_, logical.not_, logical.and_, logical.xor_}, {logical.and_},
+        ...     'depth'
+        ... )
+        >>> len(ri.indices(depth=1))
+        128
+
+        Reverse indices are stored in the persistent :obj:`~circuitdb.core.cache`,
+        so they are not derived again by other processes.
+
+        >>> metrics = circuitdb.index(2, 2).metrics
+        >>> _indices.clear() # Simulate another process.
+        >>> metrics == circuitdb.index(2, 2).metrics
+        True
+        >>> 'reverseindex_2_2_every_every' in os.listdir(cache.directory())
+        True
+        """
+        key = self._key(arity, coarity, operators, minimize, objective)
+        if objective == 'pareto':
+            raise ValueError(
+                "reverse indices are only available for the 'size' and 'depth' objectives"
+            )
+
+        if key not in _indices:
+            # Use the metrics from the persistent cache if they are available (and
+            # if they were derived from the same records, as the table may itself
+            # be derived for an operator set that is not included in the data set).
+            (name, table) = ('reverseindex_' + _name(*key), self._table(key))
+            metrics = cache.load(name, reverseindex.version, list.__iter__(table))
+            _indices[key] = reverseindex(table, arity, coarity, key[3], metrics)
+            if metrics is None:
+                cache.store(name, _indices[key].metrics, reverseindex.version, list.__iter__(table))
+
+        return _indices[key]
+
+    def iter_table( # pylint: disable=too-many-arguments
+            self: circuitdb,
+            arity: int,
+            coarity: int = 1,
+            operators: Optional[AbstractSet[logical.logical]] = None,
+            minimize: Optional[AbstractSet[logical.logical]] = None,
+            objective: str = 'size',
+            decode: str = 'raw',
+            chunk: Optional[int] = None
+        ) -> Iterable[tuple]:
+        """
+        Iterate over all entries (in the order of their packed truth tables) of
+        the table of circuits that have the supplied arity and coarity, that are
+        constructed using the supplied operators, and that are optimized for the
+        supplied objective (with the same defaults as :obj:`__call__`). Each entry
+        is a tuple consisting of the packed truth table, the truth table, and the
+        circuit data. The entries are produced lazily from the underlying records.
+
+        >>> [(i, t) for (i, t, _) in circuitdb.iter_table(1)]
+        [(0, (0, 0)), (1, (0, 1)), (2, (1, 0)), (3, (1, 1))]
+        >>> [r.to_base64() for (_, _, r) in circuitdb.iter_table(1)]
+        ['AQAGAQ==', 'BgA=', 'DAAGAQ==', 'EQAGAQ==']
+
+        The circuit data can be supplied as a :obj:`~circuitdb.core.record` (the
+        default), as a :obj:`~circuitdb.core.circuitview`, or as a
+        :obj:`~circuit.circuit.circuit` object.
+
+        >>> (_, t, v) = list(circuitdb.iter_table(2, 2, decode='view'))[107]
+        >>> t
+        ((0, 1), (1, 0), (1, 0), (1, 1))
+        >>> v.to_legible()
+        (('id',), ('id',), ('xnor', 0, 1), ('or', 0, 1), ('id', 3), ('id', 2))
+        >>> (_, _, c) = next(circuitdb.iter_table(3, decode='circuit'))
+        >>> c.gates.to_legible()
+        (('id',), ('id',), ('id',), ('uf', 0), ('id', 3))
+
+        If the objective is ``'pareto'``, the circuit data is a tuple consisting
+        of the data for each circuit on the frontier.
+
+        >>> import logical
+        >>> ops = {logical.id_, logical.not_, logical.and_, logical.or_}
+        >>> entries = circuitdb.iter_table(3, 1, ops, objective='pareto', decode='view')
+        >>> (_, _, vs) = list(entries)[41]
+        >>> [(v.count(), v.depth()) for v in vs]
+        [(7, 5), (8, 4)]
+
+        The entries can also be grouped into lists of a fixed size (*e.g.*, in
+        order to distribute them across a pool of processes).
+
+        >>> [len(entries) for entries in circuitdb.iter_table(3, chunk=100)]
+        [100, 100, 56]
+
+        Invalid arguments are detected before iteration begins.
+
+        >>> circuitdb.iter_table(3, decode='abc')
+        Traceback (most recent call last):
+          ...
+        ValueError: decoding must be 'raw', 'view', or 'circuit'
+        >>> circuitdb.iter_table(3, chunk=0)
+        Traceback (most recent call last):
+          ...
+        ValueError: chunk size must be a positive integer
+        """
+        (arity, coarity, operators, minimize, objective) = self._key(
+            arity, coarity, operators, minimize, objective
+        )
+
+        if decode not in ('raw', 'view', 'circuit'):
+            raise ValueError("decoding must be 'raw', 'view', or 'circuit'")
+
+        if chunk is not None and (not isinstance(chunk, int) or chunk < 1):
+            raise ValueError('chunk size must be a positive integer')
+
+        table = self._table((arity, coarity, operators, minimize, objective))
+
+        def decoded(bs):
+            if decode == 'raw':
+                return record(bs)
+            v = circuitview(bs, arity, coarity, table.optimal)
+            return v.to_circuit() if decode == 'circuit' else v
+
+        def entries():
+            for index in range(len(table)):
+                payload = (
+                    tuple(map(decoded, table.entry(index)))
+                    if objective == 'pareto' else
+                    decoded(list.__getitem__(table, index))
+                )
+                yield (index, _truthtable(index, arity, coarity), payload)
+
+        if chunk is None:
+            return entries()
+
+        def chunks(entries_):
+            while True:
+                entries__ = list(itertools.islice(entries_, chunk))
+                if len(entries__) == 0:
+                    break
+                yield entries__
+
+        return chunks(entries())
+
+    def equivalent(
+            self: circuitdb,
+            circuit: circuit.circuit, # pylint: disable=redefined-outer-name
+            truthtable: Optional[Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]] = None,
+            words: int = 1024
+        ) -> Union[int, bool]:
+        """
+        Compute the truth table of a :obj:`~circuit.circuit.circuit` object in a
+        single bit-sliced pass over its gates. If a truth table is supplied (in
+        any of the representations that :obj:`__call__` accepts), return whether
+        the circuit implements that function (*i.e.*, whether it is equivalent to
+        the circuits for that function in the database). Otherwise, return the
+        packed truth table of the circuit (*i.e.*, the index of the function in
+        a table of records).
+
+        >>> c = circuitdb((0, 0, 1, 0, 0, 0, 0, 1))
+        >>> circuitdb.equivalent(c)
+        33
+        >>> circuitdb.equivalent(c, (0, 0, 1, 0, 0, 0, 0, 1))
+        True
+        >>> circuitdb.equivalent(c, 0b00100001)
+        True
+        >>> circuitdb.equivalent(c, (0, 0, 1, 0, 0, 0, 1, 0))
+        False
+        >>> circuitdb.equivalent(circuitdb(((0, 1), (1, 0), (1, 0), (1, 1))))
+        107
+
+        Circuits that have many inputs are evaluated on chunks of rows of their
+        truth tables, where each chunk consists of at most the specified number
+        of 64-bit words per output (which must be a power of two).
+
+        >>> import functools
+        >>> import circuit
+        >>> import logical
+        >>> c = circuit.circuit()
+        >>> gs = [c.gate(logical.id_, is_input=True) for _ in range(10)]
+        >>> g = functools.reduce(lambda g0, g1: c.gate(logical.xor_, [g0, g1]), gs)
+        >>> _ = c.gate(logical.id_, [g], is_output=True)
+        >>> _ = c.gate(logical.id_, [gs[0]], is_output=True)
+        >>> index = circuitdb.equivalent(c)
+        >>> index == circuitdb.equivalent(c, words=1)
+        True
+        >>> table = tuple(tuple(c.evaluate(row)) for row in itertools.product((0, 1), repeat=10))
+        >>> circuitdb.equivalent(c, table, words=2)
+        True
+        >>> circuitdb.equivalent(c, table[:-1] + ((0, 0),), words=2)
+        False
+        >>> circuitdb.equivalent(c, words=3)
+        Traceback (most recent call last):
+          ...
+        ValueError: number of words must be a positive power of two
+        """
+        if not isinstance(words, int) or words < 1 or (words & (words - 1)) != 0:
+            raise ValueError('number of words must be a positive power of two')
+
+        (arity, coarity, chunks) = _simulate(circuit, words)
+
+        # The supplied truth table is converted into bytes once so that each
+        # chunk can be compared against a slice of it (the chunks are aligned
+        # to 64-bit words whenever there is more than one chunk).
+        expected = None
+        if truthtable is not None:
+            expected = _normalize(truthtable, arity, coarity)[0]
+            expected = expected.to_bytes(((2 ** arity) * coarity + 7) // 8, 'big')
+
+        index = 0
+        for (start, size, masks) in chunks:
+            # Interleave the bits of the outputs (as in a packed truth table).
+            bits = masks[0] if coarity == 1 else int(''.join(map(''.join, zip(*(
+                format(mask, '0' + str(size) + 'b') for mask in masks
+            )))), 2)
+
+            # Stop as soon as any chunk does not match the supplied truth table.
+            if expected is not None:
+                stop = len(expected) - ((2 ** arity - start - size) * coarity) // 8
+                if bits != int.from_bytes(expected[stop - (size * coarity + 7) // 8:stop], 'big'):
+                    return False
+            else:
+                index = (index << (size * coarity)) | bits
+
+        return True if expected is not None else index
 
 # Exported object with function-like and dictionary-like interfaces
 # hides the class definition that is used to construct it (unless
@@ -786,5 +971,6 @@ if os.environ.get('CIRCUITDB_DOCS') != '1':
     cls: type = circuitdb
     circuitdb: cls = cls(_db)
 
-if __name__ == '__main__':
-    doctest.testmod() # pragma: no cover
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,1569 @@
+"""
+Dependency-free core of the data set that handles the tables of circuits, the
+reverse indices of those tables, and the individual records (*i.e.*, encoded
+circuits) within those tables. Only modules from the standard library are
+imported when this module is loaded (and those that are expensive to load are
+imported only once they are needed), so services that only retrieve records or
+inspect their metrics can use this module directly.
+
+>>> rs = _db[3][1][_every][_every]['size']
+>>> circuitview(list.__getitem__(rs, 0b00100001), 3, 1).count()
+2
+
+The :obj:`~logical.logical.logical` and :obj:`~circuit.circuit.circuit` classes
+are imported only once an operator or a circuit is requested explicitly.
+
+>>> circuitview(list.__getitem__(rs, 0b00100001), 3, 1).to_circuit().gates.to_legible()
+(('id',), ('id',), ('id',), ('xor', 0, 2), ('nimp', 1, 3), ('id', 4))
+"""
+# pylint: disable=too-many-lines
+from __future__ import annotations
+import sys
+import os
+import math
+import binascii
+import itertools
+import bisect
+
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Tuple, Union, Optional, AbstractSet, Iterable, Sequence
+    import bitlist
+    import logical
+    import circuit
+
+_names: Tuple[str, ...] = (
+    'nf', 'uf', 'bf', 'and', 'nimp', 'fst', 'id', 'nif', 'snd', 'xor', 'or',
+    'nt', 'not', 'nor', 'xnor', 'nsnd', 'if', 'ut', 'nfst', 'imp', 'nand', 'bt'
+)
+"""
+Private table of the names of the encoded operators (indexed by encoding).
+"""
+
+_operators: Tuple[Tuple[int, ...], ...] = tuple(sorted(
+    bits
+    for length in (1, 2, 4)
+    for bits in itertools.product((0, 1), repeat=length)
+))
+"""
+Private table for converting an encoded operator into the truth table of that
+operator (the encoding of an operator is its position within this table). Each
+entry is equal to (and has the same hash as) the corresponding instance of the
+:obj:`~logical.logical.logical` class, so entries can be compared with such
+instances (and used to look up such instances in sets and dictionaries) without
+importing the ``logical`` library.
+
+>>> import logical
+>>> _operators == tuple(sorted(logical.every))
+True
+>>> [o.name() for o in sorted(logical.every)] == list(_names)
+True
+"""
+
+_named: dict = dict(zip(_names, _operators))
+"""
+Private dictionary that maps the name of each operator to its truth table.
+"""
+
+_codes: dict = {operator: code for (code, operator) in enumerate(_operators)}
+"""
+Private dictionary that maps each operator to its encoding.
+"""
+
+_arities: bytes = bytes(len(operator).bit_length() - 1 for operator in _operators)
+"""
+Private table of the arities of the encoded operators (indexed by encoding).
+"""
+
+_every: frozenset = frozenset(_operators)
+"""
+Private set of all operators (equal to :obj:`~logical.logical.logical.every`).
+"""
+
+_logicals: list = []
+"""
+Private table of the :obj:`~logical.logical.logical` instances that correspond
+to the encoded operators (populated once it is first needed).
+"""
+
+def _logical(code: int) -> logical.logical:
+    """
+    Private function that converts an encoded operator into an instance of the
+    :obj:`~logical.logical.logical` class (importing the ``logical`` library
+    only when this function is first invoked).
+
+    >>> _logical(9).name()
+    'xor'
+    """
+    if len(_logicals) == 0:
+        import logical # pylint: disable=import-outside-toplevel,redefined-outer-name
+        _logicals.extend(sorted(logical.every))
+
+    return _logicals[code]
+
+def _truthtable(
+        index: int,
+        arity: int,
+        coarity: int
+    ) -> Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]:
+    """
+    Private function that converts an index into a table of records (*i.e.*,
+    the integer represented by the bits of the packed truth table) back into
+    a truth table representation.
+
+    >>> _truthtable(1, 3, 1)
+    (0, 0, 0, 0, 0, 0, 0, 1)
+    >>> _truthtable(6, 1, 2)
+    ((0, 1), (1, 0))
+    """
+    bs = tuple(map(int, format(index, '0' + str((2 ** arity) * coarity) + 'b')))
+    if coarity == 1:
+        return bs
+
+    return tuple(bs[j: j + coarity] for j in range(0, len(bs), coarity))
+
+_bits: bytes = bytes.maketrans(bytes([0, 1]), b'01')
+"""
+Private translation table for converting a sequence of bit values into digits.
+"""
+
+_decrement: bytes = bytes([255]) + bytes(range(255))
+"""
+Private translation table for decrementing the bytes in the binary format that
+is used for the files of circuit data (where zero separates the records).
+"""
+
+def _normalize( # pylint: disable=too-many-branches
+        truthtable: Union[
+            Tuple[int, ...], Tuple[Tuple[int, ...], ...],
+            int, bytes, bytearray, bitlist.bitlist
+        ],
+        arity: Optional[int] = None,
+        coarity: Optional[int] = None
+    ) -> Tuple[int, int, int]:
+    """
+    Private function that validates a truth table (in any supported representation)
+    and converts it into a packed truth table (*i.e.*, an index into a table of
+    records), its arity, and its coarity. The arity and coarity of a truth table
+    that is supplied as an integer must be specified. The coarity of a truth table
+    that is supplied as a bytes-like object or as a bit list is one unless it is
+    specified.
+
+    >>> _normalize((0, 0, 0, 0, 0, 0, 0, 1))
+    (1, 3, 1)
+    >>> _normalize(((0, 1), (1, 0), (1, 0), (1, 1)))
+    (107, 2, 2)
+    >>> _normalize(107, 2, 2)
+    (107, 2, 2)
+    >>> _normalize(1, 40)
+    (1, 40, 1)
+    >>> _normalize(2 ** 64, 6)
+    Traceback (most recent call last):
+      ...
+    ValueError: truth table integer is out of range for the specified arity
+    >>> _normalize(bytes([0, 1, 1, 0, 1, 0, 1, 1]), coarity=2)
+    (107, 2, 2)
+    >>> import bitlist
+    >>> _normalize(bitlist.bitlist('0001'))
+    (1, 2, 1)
+    """
+    # A bit list can only be supplied if the ``bitlist`` library has already
+    # been imported (so it need not be imported in order to check for one).
+    bitlists = (sys.modules['bitlist'].bitlist,) if 'bitlist' in sys.modules else ()
+
+    if isinstance(truthtable, tuple):
+        # Convert the entries into a bytes-like object in a single pass (falling
+        # back to comparisons for entries that are not integers or booleans).
+        tuples = len(truthtable) > 0 and all(isinstance(e, tuple) for e in truthtable)
+        try:
+            bs = b''.join(map(bytes, truthtable)) if tuples else bytes(truthtable)
+        except (TypeError, ValueError):
+            bs = None
+
+        if bs is None or len(bs.translate(None, bytes([0, 1]))) > 0:
+            entries = [b for e in truthtable for b in e] if tuples else truthtable
+            if not all(b in (0, 1, False, True) for b in entries):
+                raise TypeError(
+                    'truth table must contain boolean values, integers in the ' +
+                    'range [0, 1], or tuples of such'
+                )
+            bs = bytes(map(int, entries))
+
+        length = len(truthtable)
+        if length < 1 or (length & (length - 1)) != 0:
+            raise ValueError('truth table must have a length that is a power of two')
+
+        # Determine the number of outputs in the truth table (and check it is consistent).
+        coarity_ = 1
+        if tuples:
+            ls = set(map(len, truthtable))
+            if len(ls) != 1:
+                raise ValueError('truth table entries must all have the same length')
+            coarity_ = ls.pop()
+            if coarity_ < 1:
+                raise ValueError('truth table entries must each represent at least one value')
+
+        (index, arity_) = (int(bs.translate(_bits), 2), length.bit_length() - 1)
+
+    elif isinstance(truthtable, (int, bytes, bytearray) + bitlists):
+        coarity_ = 1 if coarity is None else coarity
+        if not isinstance(coarity_, int) or coarity_ < 1:
+            raise ValueError('coarity must be a positive integer')
+
+        if isinstance(truthtable, int):
+            if not isinstance(arity, int) or arity < 0:
+                raise ValueError(
+                    'arity must be specified for a truth table that is an integer'
+                )
+            # The bound is never built as an integer (its size is exponential
+            # in the number of rows of the truth table).
+            if truthtable < 0 or truthtable.bit_length() > (2 ** arity) * coarity_:
+                raise ValueError('truth table integer is out of range for the specified arity')
+            (index, length) = (int(truthtable), 2 ** arity)
+        else:
+            if isinstance(truthtable, bitlists):
+                index = int(truthtable)
+            else:
+                if len(truthtable.translate(None, bytes([0, 1]))) > 0:
+                    raise TypeError(
+                        'truth table must contain boolean values, integers in the ' +
+                        'range [0, 1], or tuples of such'
+                    )
+                index = int(bytes(truthtable).translate(_bits) or b'0', 2)
+
+            length = len(truthtable) // coarity_
+            if length < 1 or (length & (length - 1)) != 0 or len(truthtable) % coarity_ != 0:
+                raise ValueError('truth table must have a length that is a power of two')
+
+        arity_ = length.bit_length() - 1
+
+    else:
+        raise TypeError(
+            'truth table must be a tuple, an integer, a bytes-like object, or a bit list'
+        )
+
+    if (arity is not None and arity != arity_) or (coarity is not None and coarity != coarity_):
+        raise ValueError('truth table does not have the specified arity and coarity')
+
+    return (index, arity_, coarity_)
+
+def _apply(operator: Tuple[int, ...], masks: Sequence[int], full: int) -> int:
+    """
+    Apply an operator to bit vectors that represent the values of its inputs
+    across all rows of a truth table (all bit vectors fit within ``full``).
+
+    >>> import logical
+    >>> _apply(logical.xor_, [0b0011, 0b0101], 0b1111) == 0b0110
+    True
+    >>> _apply(logical.not_, [0b0011], 0b1111) == 0b1100
+    True
+    >>> _apply(logical.nt_, [], 0b1111) == 0b1111
+    True
+    """
+    result = 0
+    for (row, bit) in enumerate(operator):
+        if bit:
+            term = full
+            for (j, mask) in enumerate(masks):
+                term &= mask if (row >> (len(masks) - 1 - j)) & 1 else full ^ mask
+            result |= term
+
+    return result
+
+class record(bytes):
+    """
+    Wrapper class for an individual record (*i.e.*, encoded data corresponding to a
+    circuit).
+    """
+    @staticmethod
+    def from_circuit(
+            circuit: circuit.circuit # pylint: disable=redefined-outer-name
+        ) -> record:
+        """
+        Encode a :obj:`~circuit.circuit.circuit` object and construct a record that
+        represents it.
+
+        >>> import circuit
+        >>> import logical
+        >>> c = circuit.circuit()
+        >>> g0 = c.gate(logical.id_, is_input=True)
+        >>> g1 = c.gate(logical.id_, is_input=True)
+        >>> g2 = c.gate(logical.id_, is_input=True)
+        >>> g3 = c.gate(logical.xor_, [g0, g2])
+        >>> g4 = c.gate(logical.nimp_, [g1, g3])
+        >>> g5 = c.gate(logical.id_, [g4], is_output=True)
+        >>> record.from_circuit(c).to_base64()
+        'CQACBAEDBgQ='
+        """
+        # Convert gate data into a list of integers. Note that the number of gates
+        # (including input and output gates) must not exceed 256.
+        bs = []
+        for g in circuit.gates:
+            if not g.is_input:
+                bs.extend(
+                    [_codes[g.operation]] +
+                    [circuit.gates.index(gi) for gi in g.inputs]
+                )
+
+        return record(bytes(bs))
+
+    @staticmethod
+    def from_base64(string: str) -> record:
+        """
+        Construct an instance from a Base64-encoded string representation of a record.
+
+        >>> record.from_base64('CQACBAEDBgQ=').hex()
+        '0900020401030604'
+        """
+        return record(binascii.a2b_base64(string))
+
+    def to_circuit(
+            self: record,
+            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+        ) -> circuit.circuit:
+        """
+        Decode this record into a :obj:`~circuit.circuit.circuit` object.
+
+        >>> c = record.from_base64('CQACBAEDBgQ=').to_circuit((0, 0, 1, 0, 0, 0, 0, 1))
+        >>> c.gates.to_legible()
+        (('id',), ('id',), ('id',), ('xor', 0, 2), ('nimp', 1, 3), ('id', 4))
+        """
+        arity = int(math.log2(len(truthtable)))
+        coarity = len(truthtable[0]) if isinstance(truthtable[0], tuple) else 1
+        return circuitview(self, arity, coarity).to_circuit()
+
+    def to_base64(self: record) -> str:
+        """
+        Convert this instance into a Base64-encoded string representation.
+
+        >>> import circuit
+        >>> import logical
+        >>> c = circuit.circuit()
+        >>> g0 = c.gate(logical.id_, is_input=True)
+        >>> g1 = c.gate(logical.not_, [g0])
+        >>> g2 = c.gate(logical.id_, [g1], is_output=True)
+        >>> record.from_circuit(c).to_base64()
+        'DAAGAQ=='
+        """
+        return binascii.b2a_base64(self, newline=False).decode('utf-8')
+
+class circuitview:
+    """
+    Lightweight read-only view of a record (*i.e.*, of the encoded data
+    corresponding to a circuit) that supports inspection of the gates of
+    the circuit without building a :obj:`~circuit.circuit.circuit` object.
+
+    >>> v = circuitview(record.from_base64('CQACBAEDBgQ='), 3, 1)
+    >>> v.to_legible()
+    (('id',), ('id',), ('id',), ('xor', 0, 2), ('nimp', 1, 3), ('id', 4))
+
+    Each gate is represented as a pair consisting of the operator corresponding
+    to that gate and a tuple of the indices of its input gates. The gates of the
+    view can be retrieved individually or by iterating over the view.
+
+    >>> import logical
+    >>> len(v)
+    6
+    >>> v[3] == (logical.xor_, (0, 2))
+    True
+    >>> [g for (g, _) in v][-2:] == [logical.nimp_, logical.id_]
+    True
+    >>> v.inputs
+    (0, 1, 2)
+    >>> v.outputs
+    (5,)
+
+    The metrics of the circuit (and its human-readable representation) are
+    computed directly from the encoded operators, so operators are converted
+    into :obj:`~logical.logical.logical` instances only if gates are retrieved.
+
+    A view of a circuit from a table that is derived for an operator set
+    that is not included in the data set is marked as not being known to
+    be optimal.
+
+    >>> (v.optimal, circuitview(v.record, 3, 1, False).optimal)
+    (True, False)
+
+    A :obj:`~circuit.circuit.circuit` object is only constructed if it is
+    requested explicitly.
+
+    >>> v.to_circuit().gates.to_legible()
+    (('id',), ('id',), ('id',), ('xor', 0, 2), ('nimp', 1, 3), ('id', 4))
+    """
+    __slots__ = ('record', 'arity', 'coarity', 'optimal', '_offsets')
+
+    def __init__(
+            self: circuitview,
+            record_: bytes,
+            arity: int,
+            coarity: int,
+            optimal: bool = True
+        ):
+        self.record = record_
+        self.arity = arity
+        self.coarity = coarity
+        self.optimal = optimal
+
+        # Determine the offset of each encoded (non-input) gate within the record.
+        self._offsets = []
+        j = 0
+        while j < len(record_):
+            self._offsets.append(j)
+            j += 1 + _arities[record_[j]]
+
+    def __len__(self: circuitview) -> int:
+        """
+        Return the total number of gates (including input and output gates).
+        """
+        return self.arity + len(self._offsets)
+
+    def encoded(self: circuitview) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        """
+        Yield the encoded operator and the input gate indices of each gate (in
+        order).
+        """
+        for _ in range(self.arity):
+            yield (_codes[_named['id']], ())
+
+        for j in self._offsets:
+            yield (self.record[j], tuple(self.record[j + 1: j + 1 + _arities[self.record[j]]]))
+
+    def __getitem__(
+            self: circuitview,
+            index: int
+        ) -> Tuple[logical.logical, Tuple[int, ...]]:
+        """
+        Return the operator and the input gate indices of the gate at the
+        specified index.
+
+        >>> import logical
+        >>> v = circuitview(record.from_base64('CQACBAEDBgQ='), 3, 1)
+        >>> v[0] == (logical.id_, ())
+        True
+        >>> v[-1] == (logical.id_, (4,))
+        True
+        >>> v[6]
+        Traceback (most recent call last):
+          ...
+        IndexError: gate index out of range
+        """
+        index = index + len(self) if index < 0 else index
+        if not 0 <= index < len(self):
+            raise IndexError('gate index out of range')
+
+        if index < self.arity:
+            return (_logical(_codes[_named['id']]), ())
+
+        j = self._offsets[index - self.arity]
+        return (
+            _logical(self.record[j]),
+            tuple(self.record[j + 1: j + 1 + _arities[self.record[j]]])
+        )
+
+    def __iter__(self: circuitview) -> Iterable[Tuple[logical.logical, Tuple[int, ...]]]:
+        """
+        Yield the operator and the input gate indices of each gate (in order).
+        """
+        for (code, inputs) in self.encoded():
+            yield (_logical(code), inputs)
+
+    @property
+    def gates(self: circuitview) -> Tuple[Tuple[logical.logical, Tuple[int, ...]], ...]:
+        """
+        Tuple of all gates (each represented as an operator and a tuple of input
+        gate indices).
+
+        >>> import logical
+        >>> circuitview(record.from_base64('DAAGAQ=='), 1, 1).gates == (
+        ...     (logical.id_, ()), (logical.not_, (0,)), (logical.id_, (1,))
+        ... )
+        True
+        """
+        return tuple(self)
+
+    @property
+    def inputs(self: circuitview) -> Tuple[int, ...]:
+        """
+        Tuple of the indices of the input gates.
+        """
+        return tuple(range(self.arity))
+
+    @property
+    def outputs(self: circuitview) -> Tuple[int, ...]:
+        """
+        Tuple of the indices of the output gates.
+        """
+        return tuple(range(len(self) - self.coarity, len(self)))
+
+    def count(
+            self: circuitview,
+            operators: Optional[AbstractSet[logical.logical]] = None
+        ) -> int:
+        """
+        Count the number of internal gates (*i.e.*, gates that are neither input
+        nor output gates) that correspond to an operator in the supplied set. If
+        no set is supplied, all internal gates are counted.
+
+        >>> import logical
+        >>> v = circuitview(record.from_base64('CQACBAEDBgQ='), 3, 1)
+        >>> v.count()
+        2
+        >>> v.count({logical.xor_})
+        1
+        """
+        return sum(
+            1
+            for j in self._offsets[:len(self._offsets) - self.coarity]
+            if operators is None or _operators[self.record[j]] in operators
+        )
+
+    def depth(
+            self: circuitview,
+            operators: Optional[AbstractSet[logical.logical]] = None
+        ) -> int:
+        """
+        Calculate the maximum number of internal gates that correspond to an
+        operator in the supplied set along any path from an input gate to an
+        output gate. If no set is supplied, all internal gates are counted.
+
+        >>> import logical
+        >>> v = circuitview(record.from_base64('CQACBAEDBgQ='), 3, 1)
+        >>> v.depth()
+        2
+        >>> v.depth({logical.nimp_})
+        1
+        """
+        depths = [0] * len(self)
+        for (index, (code, inputs)) in enumerate(self.encoded()):
+            depths[index] = max((depths[k] for k in inputs), default=0) + (
+                1
+                if (
+                    self.arity <= index < len(self) - self.coarity and
+                    (operators is None or _operators[code] in operators)
+                ) else
+                0
+            )
+
+        return max((depths[k] for k in self.outputs), default=0)
+
+    def to_legible(self: circuitview) -> tuple:
+        """
+        Return a human-readable representation of the gates in this view (matching
+        that of the :obj:`~circuit.circuit.gates.to_legible` method).
+
+        >>> circuitview(record.from_base64('DAAGAQ=='), 1, 1).to_legible()
+        (('id',), ('not', 0), ('id', 1))
+        """
+        return tuple((_names[code],) + inputs for (code, inputs) in self.encoded())
+
+    def to_circuit(self: circuitview) -> circuit.circuit:
+        """
+        Build the :obj:`~circuit.circuit.circuit` object that this view represents
+        (importing the ``circuit`` library only when a circuit is first built).
+
+        >>> c = circuitview(record.from_base64('DAAGAQ=='), 1, 1).to_circuit()
+        >>> c.gates.to_legible()
+        (('id',), ('not', 0), ('id', 1))
+        """
+        import circuit # pylint: disable=import-outside-toplevel,redefined-outer-name
+        c = circuit.circuit()
+        gs = []
+        for _ in range(self.arity): # Input gates.
+            gs.append(c.gate(_logical(_codes[_named['id']]), [], is_input=True))
+        ts = self.gates
+        for (operator, inputs) in ts[self.arity:-self.coarity]: # Internal gates.
+            gs.append(c.gate(operator, [gs[k] for k in inputs]))
+        for (operator, inputs) in ts[-self.coarity:]: # Output gates.
+            c.gate(operator, [gs[k] for k in inputs], is_output=True)
+
+        return c
+
+class records(list):
+    """
+    Wrapper class for a base-level operation-to-circuit map (corresponding to a fixed
+    combination of arity, coarity, operator set, and operator set to minimize).
+    """
+    optimal: bool = True
+    """
+    Indicates whether every circuit in this instance is known to be optimal (this
+    is not the case for tables that are derived for other operator sets).
+    """
+
+    @staticmethod
+    def from_bytes(data: bytes) -> records:
+        """
+        Construct an instance from circuit data in the binary format that is used
+        for the files of circuit data.
+
+        >>> rs = records.from_bytes(bytes([13, 1, 7, 2, 0, 7, 1]))
+        >>> rs == [bytes([12, 0, 6, 1]), bytes([6, 0])]
+        True
+        """
+        # Decrement every byte in a single pass (which maps each separator to the
+        # only byte value that cannot occur within the data of a record).
+        return records(data.translate(_decrement).split(bytes([255])))
+
+    @staticmethod
+    def from_file(resource: str) -> records:
+        """
+        Construct an instance from a binary file of circuit data (where the specified
+        resource is either a package resource of this package or a file path).
+
+        >>> len(records.from_file('3_1_every_every'))
+        256
+        """
+        # The files of this package are usually located alongside this module (in
+        # which case the comparatively expensive resource loader is not needed).
+        packaged = os.path.join(os.path.dirname(os.path.abspath(__file__)), resource)
+        if os.path.exists(resource) or os.path.exists(packaged):
+            with open(resource if os.path.exists(resource) else packaged, 'rb') as file:
+                data = file.read()
+        else: # pragma: no cover
+            import importlib.resources # pylint: disable=import-outside-toplevel
+
+            # Support Python version 3.7 and above.
+            if sys.version_info.minor >= 9:
+                # Available in Python version 3.9 and above.
+                with { # pylint: disable=no-member
+                    r.name: r
+                    for r in importlib.resources.files('circuitdb').iterdir()
+                }[resource].open('rb') as file:
+                    data = file.read()
+            else:
+                # Not deprecated in Python version 3.10 and below.
+                data = importlib.resources.read_binary('circuitdb', resource)
+
+        return records.from_bytes(data)
+
+    def to_bytes(self: records) -> bytes:
+        """
+        Convert the data in this instance into the binary format that is used for
+        the files of circuit data.
+
+        >>> records([bytes([12, 0, 6, 1]), bytes([6, 0])]).to_bytes().hex()
+        '0d010702000701'
+        """
+        bs = []
+        for (j, r) in enumerate(self):
+            bs.extend(
+                [b + 1 for b in record(r)] +
+                ([] if j == len(self) - 1 else [0])
+            )
+
+        return bytes(bs)
+
+    def to_file(self: records, path: str):
+        """
+        Write the data in this instance to a binary file.
+
+        >>> rs = records.from_file('3_1_every_every')
+        >>> rs.to_file('test-output-records.to_file')
+        >>> len(records.from_file('test-output-records.to_file'))
+        256
+        >>> os.remove('test-output-records.to_file')
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    def view(
+            self: records,
+            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+        ) -> circuitview:
+        """
+        Data retrieval wrapper that performs normalization of the truth table
+        (without checking that its arity and coarity match those of the data)
+        and returns a lightweight :obj:`circuitview` instance for the corresponding
+        record.
+
+        >>> rs = records.from_file('3_1_every_every')
+        >>> rs.view((0, 0, 1, 0, 0, 0, 0, 1)).to_legible()
+        (('id',), ('id',), ('id',), ('xor', 0, 2), ('nimp', 1, 3), ('id', 4))
+        """
+        (index, arity, coarity) = _normalize(truthtable)
+        return circuitview(super().__getitem__(index), arity, coarity, self.optimal)
+
+    def __getitem__(
+            self: records,
+            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+        ) -> circuit.circuit:
+        """
+        Data retrieval wrapper that performs normalization of the truth table,
+        but does not check that its arity and coarity match those of the data. To
+        ensure the supplied truth table representation is valid, the
+        :obj:`circuitdb.__call__` should be used to retrieve circuit data.
+        """
+        # Retrieve, decode, and return the circuit data.
+        return self.view(truthtable).to_circuit()
+
+class frontiers:
+    """
+    Wrapper class for a base-level operation-to-frontier map that combines the
+    tables of circuits optimized for different objectives (corresponding to a
+    fixed combination of arity, coarity, operator set, and operator set to
+    minimize). The frontier for a function consists of the circuits from those
+    tables that are Pareto-optimal with respect to size and depth (where only
+    gates corresponding to operators in the operator set to minimize are counted),
+    ordered from the smallest circuit to the shallowest circuit.
+
+    >>> import logical
+    >>> ops = frozenset({logical.id_, logical.not_, logical.and_, logical.or_})
+    >>> fs = frontiers((_db[3][1][ops][ops]['size'], _db[3][1][ops][ops]['depth']), 3, 1, ops)
+    >>> len(fs)
+    256
+    >>> [(v.count(), v.depth()) for v in fs.view((0, 0, 1, 0, 1, 0, 0, 0))]
+    [(5, 4), (6, 3)]
+    >>> [c.gates.to_legible() for c in fs[(0, 0, 0, 0, 0, 0, 0, 1)]]
+    [(('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))]
+    """
+    def __init__(
+            self: frontiers,
+            tables: Sequence[records],
+            arity: int,
+            coarity: int,
+            minimize: AbstractSet[logical.logical]
+        ):
+        self.tables = tuple(tables)
+        self.arity = arity
+        self.coarity = coarity
+        self.minimize = minimize
+
+    @property
+    def optimal(self: frontiers) -> bool:
+        """
+        Indicates whether every circuit in the tables combined by this instance
+        is known to be optimal.
+        """
+        return all(rs.optimal for rs in self.tables)
+
+    def __len__(self: frontiers) -> int:
+        """
+        Return the number of functions (and thus of frontiers) in this instance.
+        """
+        return len(self.tables[0])
+
+    def entry(self: frontiers, index: int) -> Tuple[bytes, ...]:
+        """
+        Return the records of the circuits on the frontier for the function that
+        has the supplied packed truth table.
+
+        >>> fs = _db[2][2][_every][_every]['pareto']
+        >>> [record(bs).to_base64() for bs in fs.entry(107)]
+        ['DgABCgABBgMGAg==']
+        """
+        candidates = []
+        for rs in self.tables:
+            bs = list.__getitem__(rs, index)
+            v = circuitview(bs, self.arity, self.coarity)
+            candidates.append(((v.count(self.minimize), v.count()), v.depth(self.minimize), bs))
+
+        # Keep each circuit that is shallower than all circuits that are smaller.
+        frontier = []
+        for (_, depth, bs) in sorted(candidates, key=lambda candidate: candidate[:2]):
+            if len(frontier) == 0 or depth < frontier[-1][0]:
+                frontier.append((depth, bs))
+
+        return tuple(bs for (_, bs) in frontier)
+
+    def view(
+            self: frontiers,
+            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+        ) -> Tuple[circuitview, ...]:
+        """
+        Data retrieval wrapper that performs normalization of the truth table
+        (without checking that its arity and coarity match those of the data)
+        and returns a lightweight :obj:`circuitview` instance for each circuit
+        on the frontier.
+        """
+        (index, arity, coarity) = _normalize(truthtable)
+        return tuple(circuitview(bs, arity, coarity, self.optimal) for bs in self.entry(index))
+
+    def __getitem__(
+            self: frontiers,
+            truthtable: Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+        ) -> Tuple[circuit.circuit, ...]:
+        """
+        Data retrieval wrapper that performs normalization of the truth table
+        and returns the circuits on the frontier (with the same caveats as
+        :obj:`records.__getitem__`).
+        """
+        return tuple(v.to_circuit() for v in self.view(truthtable))
+
+class reverseindex:
+    """
+    Sorted reverse index for a base-level operation-to-circuit map (*i.e.*, a
+    :obj:`records` instance) that maps the metrics of each circuit (its number
+    of internal gates, its depth, and its number of internal gates of each kind)
+    to the packed truth tables of the functions that the circuits implement.
+    A packed truth table is the integer that corresponds to the bits of the
+    truth table (which is also the position of its record within the table).
+    The number of internal gates and the depth only take into account the gates
+    that correspond to an operator in the supplied set of operators to minimize
+    (as in the table from which the records are drawn). If no set is supplied,
+    all internal gates are taken into account.
+
+    >>> ri = reverseindex(records.from_file('3_1_every_every'), 3, 1)
+    >>> ri.indices(gates=0)
+    (15, 51, 85)
+    >>> ri.truthtables(gates=0)
+    ((0, 0, 0, 0, 1, 1, 1, 1), (0, 0, 1, 1, 0, 0, 1, 1), (0, 1, 0, 1, 0, 1, 0, 1))
+
+    Bounds can be specified either as an integer (in which case it is treated as
+    an upper bound) or as a pair of integers (in which case both bounds are
+    inclusive). Bounds on the number of internal gates of each kind can be
+    specified using a dictionary that maps operators to bounds.
+
+    >>> import logical
+    >>> len(ri.indices(gates=1))
+    38
+    >>> len(ri.indices(gates=(2, 3), depth=2))
+    174
+    >>> ri.indices(operators={logical.xor_: (2, 3)})
+    (23, 24, 36, 66, 104, 105, 126, 129, 189, 219, 231)
+
+    The metrics of circuits that minimize only some operators (such as the
+    number of AND gates and the AND-depth) can be queried using the same
+    bounds.
+
+    >>> rs = records.from_file('3_1_id-not-and-xor_and_depth')
+    >>> ri = reverseindex(rs, 3, 1, {logical.and_})
+    >>> len(ri.indices(depth=1))
+    128
+    >>> ri.indices(gates=0) == ri.indices(depth=0)
+    True
+    """
+    version: int = 2
+    """
+    Version of the format of the metrics (with which the metrics are stored in
+    the persistent :obj:`cache`).
+    """
+
+    def __init__(
+            self: reverseindex,
+            records_: records,
+            arity: int,
+            coarity: int,
+            minimize: Optional[AbstractSet[logical.logical]] = None,
+            metrics: Optional[bytes] = None
+        ):
+        self.arity = arity
+        self.coarity = coarity
+
+        # Derive the metrics of every circuit (unless they are supplied). The
+        # metrics of each circuit occupy a fixed number of bytes.
+        if metrics is None:
+            bs_ = bytearray()
+            for bs in list.__iter__(records_):
+                v = circuitview(bs, arity, coarity)
+                histogram = [0] * len(_operators)
+                for (code, _) in itertools.islice(v.encoded(), arity, len(v) - coarity):
+                    histogram[code] += 1
+                bs_.extend([v.count(minimize), v.depth(minimize)] + histogram)
+            metrics = bytes(bs_)
+        self.metrics = metrics
+
+        width = 2 + len(_operators)
+        self._entries = sorted(
+            (
+                metrics[j], metrics[j + 1],
+                tuple(metrics[j + 2: j + width]),
+                j // width
+            )
+            for j in range(0, len(metrics), width)
+        )
+        self._gates = [entry[0] for entry in self._entries]
+
+    @staticmethod
+    def _bounds(bounds: Union[None, int, Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Normalize an upper bound or a pair of inclusive bounds.
+        """
+        if bounds is None:
+            return (0, 2 ** 16)
+
+        if isinstance(bounds, int):
+            return (0, bounds)
+
+        if not (
+            isinstance(bounds, tuple) and len(bounds) == 2 and
+            all(isinstance(bound, int) for bound in bounds)
+        ):
+            raise TypeError('bounds must be an integer or a pair of integers')
+
+        return bounds
+
+    def indices(
+            self: reverseindex,
+            gates: Union[None, int, Tuple[int, int]] = None,
+            depth: Union[None, int, Tuple[int, int]] = None,
+            operators: Optional[dict] = None
+        ) -> Tuple[int, ...]:
+        """
+        Return the sorted packed truth tables of all functions for which the
+        corresponding circuits satisfy the supplied bounds.
+
+        >>> ri = reverseindex(records.from_file('3_1_every_every'), 3, 1)
+        >>> len(ri.indices(gates=(4, 4)))
+        24
+        >>> ri.indices(gates='abc')
+        Traceback (most recent call last):
+          ...
+        TypeError: bounds must be an integer or a pair of integers
+        >>> ri.indices(operators={(0, 1, 0): 1})
+        Traceback (most recent call last):
+          ...
+        ValueError: bounds must only be specified for valid operators
+        """
+        (gates_lower, gates_upper) = reverseindex._bounds(gates)
+        (depth_lower, depth_upper) = reverseindex._bounds(depth)
+
+        operators = {} if operators is None else operators
+        if not set(operators.keys()).issubset(_every):
+            raise ValueError('bounds must only be specified for valid operators')
+
+        histogram_bounds = [
+            (_codes[operator], reverseindex._bounds(bounds))
+            for (operator, bounds) in operators.items()
+        ]
+
+        return tuple(sorted(
+            index
+            for (_, depth_, histogram, index) in self._entries[
+                bisect.bisect_left(self._gates, gates_lower):
+                bisect.bisect_right(self._gates, gates_upper)
+            ]
+            if depth_lower <= depth_ <= depth_upper and all(
+                lower <= histogram[j] <= upper
+                for (j, (lower, upper)) in histogram_bounds
+            )
+        ))
+
+    def truthtables(
+            self: reverseindex,
+            gates: Union[None, int, Tuple[int, int]] = None,
+            depth: Union[None, int, Tuple[int, int]] = None,
+            operators: Optional[dict] = None
+        ) -> Tuple[Union[Tuple[int, ...], Tuple[Tuple[int, ...], ...]], ...]:
+        """
+        Return the truth tables (in the order of their packed representations)
+        of all functions for which the corresponding circuits satisfy the
+        supplied bounds.
+
+        >>> ri = reverseindex(records.from_file('2_2_every_every'), 2, 2)
+        >>> ri.truthtables(gates=0)[1:3]
+        (((0, 0), (0, 1), (1, 0), (1, 1)), ((0, 0), (1, 0), (0, 1), (1, 1)))
+        """
+        return tuple(
+            _truthtable(index, self.arity, self.coarity)
+            for index in self.indices(gates, depth, operators)
+        )
+
+class cache:
+    """
+    Persistent on-disk cache of artifacts (such as reverse indices) that are
+    derived from the data set. Each artifact is stored in its own file together
+    with a digest of the data set and of the version of this library, with the
+    version of the format of that artifact (and of the algorithm used to derive
+    it), and with a digest of any other data from which it is derived. Any
+    cached artifact is ignored (and eventually replaced) if any of these
+    changes, so the version of an artifact must be incremented whenever the
+    data that is derived for it changes. Files are written atomically, so
+    processes that populate the cache concurrently cannot corrupt it.
+
+    >>> cache.load('example') is None
+    True
+    >>> cache.store('example', bytes([1, 2, 3]))
+    >>> cache.load('example')
+    b'\\x01\\x02\\x03'
+
+    Artifacts that have a different version or that do not have a valid header
+    are ignored.
+
+    >>> cache.store('example', bytes([1, 2, 3]), 2)
+    >>> cache.load('example', 2)
+    b'\\x01\\x02\\x03'
+    >>> (cache.load('example'), cache.load('example', 3))
+    (None, None)
+
+    Artifacts that are derived from other data (such as the reverse indices of
+    tables that are themselves derived) are also ignored if that data changes.
+
+    >>> cache.store('example', bytes([1, 2, 3]), 2, [bytes([4]), bytes([5, 6])])
+    >>> cache.load('example', 2, [bytes([4]), bytes([5, 6])])
+    b'\\x01\\x02\\x03'
+    >>> (cache.load('example', 2), cache.load('example', 2, [bytes([4, 5]), bytes([6])]))
+    (None, None)
+    >>> with open(os.path.join(cache.directory(), 'example'), 'wb') as file:
+    ...     _ = file.write(bytes([1, 2, 3]))
+    >>> cache.load('example') is None
+    True
+
+    Failures to write to the cache are ignored.
+
+    >>> cache.path = os.path.join(cache.directory(), 'example', 'example')
+    >>> cache.store('example', bytes([1, 2, 3]))
+    >>> cache.load('example') is None
+    True
+    >>> cache.path = None
+
+    By default, the cache is located in the ``circuitdb`` subdirectory of the
+    `XDG <https://specifications.freedesktop.org/basedir-spec/latest>`__ cache
+    directory. A different location can be specified via the ``CIRCUITDB_CACHE``
+    environment variable (where an empty value disables the cache) or by
+    assigning it to the :obj:`path` attribute.
+
+    >>> variables = {k: os.environ.pop(k, None) for k in ('CIRCUITDB_CACHE', 'XDG_CACHE_HOME')}
+    >>> os.environ['XDG_CACHE_HOME'] = os.path.join('example', 'cache')
+    >>> cache.directory() == os.path.join('example', 'cache', 'circuitdb')
+    True
+    >>> _ = os.environ.pop('XDG_CACHE_HOME')
+    >>> os.environ.update({k: v for (k, v) in variables.items() if v is not None})
+    >>> cache.path = ''
+    >>> cache.directory() is None
+    True
+    >>> cache.store('example', bytes([1, 2, 3]))
+    >>> cache.load('example') is None
+    True
+    >>> cache.path = None
+    """
+    path: Optional[str] = None
+    """
+    Location of the cache (if it differs from the default location).
+    """
+
+    _digest: Optional[bytes] = None
+
+    @staticmethod
+    def directory() -> Optional[str]:
+        """
+        Return the location of the cache (or ``None`` if caching is disabled).
+        """
+        path = cache.path
+        if path is None:
+            path = os.environ.get('CIRCUITDB_CACHE')
+        if path is None:
+            path = os.path.join(
+                os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                'circuitdb'
+            )
+
+        return path if path != '' else None
+
+    @staticmethod
+    def digest() -> bytes:
+        """
+        Return the digest of the data set and of the version of this library.
+        """
+        if cache._digest is None:
+            import hashlib # pylint: disable=import-outside-toplevel
+            hash_ = hashlib.sha256()
+            try:
+                import importlib.metadata # pylint: disable=import-outside-toplevel
+                hash_.update(importlib.metadata.version('circuitdb').encode())
+            except (AttributeError, ImportError): # pragma: no cover
+                pass # Available in Python version 3.8 and above.
+
+            tables = [
+                ((arity, coarity, sorted(operators), sorted(minimize), objective), rs)
+                for (arity, coarities) in _db.items()
+                for (coarity, operators_) in coarities.items()
+                for (operators, minimizes) in operators_.items()
+                for (minimize, objectives) in minimizes.items()
+                for (objective, rs) in objectives.items()
+                if isinstance(rs, records) # Frontiers are derived from the tables.
+            ]
+            for (key, rs) in tables:
+                hash_.update(repr(key + (len(rs),)).encode())
+                for bs in list.__iter__(rs):
+                    hash_.update(len(bs).to_bytes(2, 'little') + bs)
+
+            cache._digest = b'circuitdb' + hash_.digest()
+
+        return cache._digest
+
+    @staticmethod
+    def header(version: int = 0, sources: Iterable[bytes] = ()) -> bytes:
+        """
+        Return the header of a cached artifact that has the supplied version and
+        that is derived from the supplied byte strings (in addition to the data
+        set).
+        """
+        import hashlib # pylint: disable=import-outside-toplevel
+        hash_ = hashlib.sha256()
+        for bs in sources:
+            hash_.update(len(bs).to_bytes(4, 'little') + bs)
+
+        return cache.digest() + version.to_bytes(4, 'little') + hash_.digest()
+
+    @staticmethod
+    def load(name: str, version: int = 0, sources: Iterable[bytes] = ()) -> Optional[bytes]:
+        """
+        Return the data of a cached artifact (or ``None`` if no valid artifact
+        having the specified name and version that is derived from the supplied
+        byte strings exists). Only the header is read if it is not valid.
+        """
+        directory = cache.directory()
+        if directory is None:
+            return None
+
+        header = cache.header(version, sources)
+        try:
+            with open(os.path.join(directory, name), 'rb') as file:
+                return file.read() if file.read(len(header)) == header else None
+        except OSError:
+            return None
+
+    @staticmethod
+    def store(name: str, data: bytes, version: int = 0, sources: Iterable[bytes] = ()):
+        """
+        Write the data of an artifact that has the supplied version and that is
+        derived from the supplied byte strings to the cache atomically (ignoring
+        any failures, as the artifact can always be derived again).
+        """
+        directory = cache.directory()
+        if directory is None:
+            return
+
+        import tempfile # pylint: disable=import-outside-toplevel
+        try:
+            os.makedirs(directory, exist_ok=True)
+            (descriptor, path) = tempfile.mkstemp(dir=directory, prefix='.' + name)
+            try:
+                with os.fdopen(descriptor, 'wb') as file:
+                    file.write(cache.header(version, sources))
+                    file.write(data)
+                os.replace(path, os.path.join(directory, name))
+            finally:
+                if os.path.exists(path):
+                    os.remove(path) # pragma: no cover
+        except OSError:
+            pass
+
+def _name(
+        arity: int,
+        coarity: int,
+        operators: AbstractSet[logical.logical],
+        minimize: AbstractSet[logical.logical],
+        objective: str
+    ) -> str:
+    """
+    Private function that returns the name of the table of circuits for the supplied
+    combination of arity, coarity, operator set, operator set to minimize, and
+    objective (following the naming convention of the files of circuit data).
+
+    >>> import logical
+    >>> _name(3, 1, logical.every, logical.every, 'depth')
+    '3_1_every_every_depth'
+    >>> _name(2, 2, {logical.and_, logical.not_}, {logical.and_}, 'size')
+    '2_2_not-and_and'
+
+    Operators are ordered by their arity and then by their truth tables, so the
+    name of every table that is included in the data set is the name of its file.
+
+    >>> import os
+    >>> all(
+    ...     os.path.exists(os.path.join(os.path.dirname(__file__), _name(a, c, o, m, g)))
+    ...     for (a, c) in ((2, 2), (3, 1)) for o in _db[a][c] for m in _db[a][c][o]
+    ...     for g in ('size', 'depth')
+    ... )
+    True
+    """
+    return '_'.join([str(arity), str(coarity)] + [
+        'every'
+        if operators_ == _every else
+        '-'.join(
+            name
+            for (name, o) in sorted(zip(_names, _operators), key=lambda p: (len(p[1]), p[1]))
+            if o in operators_
+        )
+        for operators_ in (operators, minimize)
+    ] + ([] if objective == 'size' else [objective]))
+
+def _derive(
+        arity: int,
+        coarity: int,
+        operators: AbstractSet[logical.logical],
+        minimize: AbstractSet[logical.logical]
+    ) -> dict:
+    """
+    Private function that retrieves the tables of circuits (for each objective)
+    that are derived for an operator set that is not included in the data set.
+    The translation engine depends on this module, so it is imported only once
+    it is needed.
+    """
+    from circuitdb.translate import derive # pylint: disable=import-outside-toplevel,cyclic-import
+    return derive(arity, coarity, operators, minimize)
+
+_indices: dict = {}
+"""
+Private dictionary object that caches reverse indices (which are built lazily).
+"""
+
+_db: dict = {}
+"""
+Private dictionary object that represents the data set.
+"""
+
+# Set up containers for each (arity, coarity, operator set, operator set
+# to minimize) combination for which data is included.
+for i in range(0, 4):
+    _db[i] = {}
+
+    if i == 0:
+        _db[i][1] = {
+            _every: {_every: {}}
+        }
+
+    if i in range(1, 4):
+        _db[i][1] = {
+            frozenset({_named['id'], _named['not'], _named['and'], _named['or']}): {
+                frozenset({_named['id'], _named['not'], _named['and'], _named['or']}): {}
+            },
+            frozenset({_named['id'], _named['not'], _named['and'], _named['xor']}): {
+                frozenset({_named['and']}): {}
+            },
+            _every: {_every: {}}
+        }
+
+    if i == 2:
+        _db[i][2] = {
+            frozenset({_named['id'], _named['not'], _named['and'], _named['or']}): {
+                frozenset({_named['id'], _named['not'], _named['and'], _named['or']}): {}
+            },
+            frozenset({_named['id'], _named['not'], _named['and'], _named['xor']}): {
+                frozenset({_named['and']}): {}
+            },
+            _every: {_every: {}}
+        }
+
+_db \
+    [1][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'DAADAAEGAg==',
+        'BgA=',
+        'DAAGAQ==',
+        'DAAKAAEGAg==',
+    ]))
+
+_db \
+    [2][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'DAADAAIGAw==',
+        'AwABBgI=',
+        'DAEDAAIGAw==',
+        'BgA=',
+        'DAADAQIGAw==',
+        'BgE=',
+        'AwABDAIKAAEDAwQGBQ==',
+        'CgABBgI=',
+        'CgABDAIGAw==',
+        'AwABCgABDAMKAgQGBQ==',
+        'DAEGAg==',
+        'DAEKAAIGAw==',
+        'DAAGAg==',
+        'DAAKAQIGAw==',
+        'AwABDAIGAw==',
+        'DAAKAAIGAw==',
+    ]))
+
+_db \
+    [2][2] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['size'] \
+    = records.from_file('2_2_id-not-and-or_id-not-and-or')
+
+_db \
+    [3][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['size'] \
+    = records.from_file('3_1_id-not-and-or_id-not-and-or')
+
+_db \
+    [1][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'DAAMAAkBAgYD',
+        'BgA=',
+        'DAAGAQ==',
+        'DAAJAAEGAg==',
+    ]))
+
+_db \
+    [2][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'DAAMAAkCAwYE',
+        'AwABBgI=',
+        'DAEDAAIGAw==',
+        'BgA=',
+        'DAADAQIGAw==',
+        'BgE=',
+        'CQABBgI=',
+        'DAADAQIJAAMGBA==',
+        'DAAMAQMCAwYE',
+        'DAAJAQIGAw==',
+        'DAEGAg==',
+        'DAADAQIMAwYE',
+        'DAAGAg==',
+        'DAADAAEJAgMGBA==',
+        'AwABDAIGAw==',
+        'DAAJAAIGAw==',
+    ]))
+
+_db \
+    [2][2] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['size'] \
+    = records.from_file('2_2_id-not-and-xor_and')
+
+_db \
+    [3][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['size'] \
+    = records.from_file('3_1_id-not-and-xor_and')
+
+_db \
+    [0][1] \
+    [_every] \
+    [_every] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'AAYA',
+        'CwYA',
+    ]))
+
+_db \
+    [1][1] \
+    [_every] \
+    [_every] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'AQAGAQ==',
+        'BgA=',
+        'DAAGAQ==',
+        'EQAGAQ==',
+    ]))
+
+_db \
+    [2][1] \
+    [_every] \
+    [_every] \
+    ['size'] \
+    = records(map(binascii.a2b_base64, [
+        'AgABBgI=',
+        'AwABBgI=',
+        'BAABBgI=',
+        'BQABBgI=',
+        'BwABBgI=',
+        'CAABBgI=',
+        'CQABBgI=',
+        'CgABBgI=',
+        'DQABBgI=',
+        'DgABBgI=',
+        'DwABBgI=',
+        'EAABBgI=',
+        'EgABBgI=',
+        'EwABBgI=',
+        'FAABBgI=',
+        'FQABBgI=',
+    ]))
+
+_db \
+    [2][2] \
+    [_every] \
+    [_every] \
+    ['size'] \
+    = records.from_file('2_2_every_every')
+
+_db \
+    [3][1] \
+    [_every] \
+    [_every] \
+    ['size'] \
+    = records.from_file('3_1_every_every')
+
+_db \
+    [1][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'DAADAAEGAg==',
+        'BgA=',
+        'DAAGAQ==',
+        'DAAKAAEGAg==',
+    ]))
+
+_db \
+    [2][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'DAADAAIGAw==',
+        'AwABBgI=',
+        'DAEDAAIGAw==',
+        'BgA=',
+        'DAADAQIGAw==',
+        'BgE=',
+        'AwABCgABDAIDAwQGBQ==',
+        'CgABBgI=',
+        'CgABDAIGAw==',
+        'AwABCgABDAMKAgQGBQ==',
+        'DAEGAg==',
+        'DAEKAAIGAw==',
+        'DAAGAg==',
+        'DAAKAQIGAw==',
+        'AwABDAIGAw==',
+        'DAAKAAIGAw==',
+    ]))
+
+_db \
+    [2][2] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['depth'] \
+    = records.from_file('2_2_id-not-and-or_id-not-and-or_depth')
+
+_db \
+    [3][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['or']})] \
+    ['depth'] \
+    = records.from_file('3_1_id-not-and-or_id-not-and-or_depth')
+
+_db \
+    [1][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'CQAABgE=',
+        'BgA=',
+        'DAAGAQ==',
+        'DAAJAAEGAg==',
+    ]))
+
+_db \
+    [2][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'CQAABgI=',
+        'AwABBgI=',
+        'DAEDAAIGAw==',
+        'BgA=',
+        'DAADAQIGAw==',
+        'BgE=',
+        'CQABBgI=',
+        'CQABAwABCQIDBgQ=',
+        'DAAMAQMCAwYE',
+        'DAAJAQIGAw==',
+        'DAEGAg==',
+        'DAEDAAEJAgMGBA==',
+        'DAAGAg==',
+        'DAADAAEJAgMGBA==',
+        'AwABDAIGAw==',
+        'DAAJAAIGAw==',
+    ]))
+
+_db \
+    [2][2] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['depth'] \
+    = records.from_file('2_2_id-not-and-xor_and_depth')
+
+_db \
+    [3][1] \
+    [frozenset({_named['id'], _named['not'], _named['and'], _named['xor']})] \
+    [frozenset({_named['and']})] \
+    ['depth'] \
+    = records.from_file('3_1_id-not-and-xor_and_depth')
+
+_db \
+    [0][1] \
+    [_every] \
+    [_every] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'AAYA',
+        'CwYA',
+    ]))
+
+_db \
+    [1][1] \
+    [_every] \
+    [_every] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'AQAGAQ==',
+        'BgA=',
+        'DAAGAQ==',
+        'EQAGAQ==',
+    ]))
+
+_db \
+    [2][1] \
+    [_every] \
+    [_every] \
+    ['depth'] \
+    = records(map(binascii.a2b_base64, [
+        'AQAGAg==',
+        'AwABBgI=',
+        'BAABBgI=',
+        'BgA=',
+        'BAEABgI=',
+        'BgE=',
+        'CQABBgI=',
+        'CgABBgI=',
+        'DQABBgI=',
+        'DgABBgI=',
+        'DAEGAg==',
+        'EAABBgI=',
+        'DAAGAg==',
+        'EAEABgI=',
+        'FAABBgI=',
+        'EQAGAg==',
+    ]))
+
+_db \
+    [2][2] \
+    [_every] \
+    [_every] \
+    ['depth'] \
+    = records.from_file('2_2_every_every_depth')
+
+_db \
+    [3][1] \
+    [_every] \
+    [_every] \
+    ['depth'] \
+    = records.from_file('3_1_every_every_depth')
+
+# Combine the tables for each combination into frontiers of circuits.
+for (i, coarities_) in _db.items():
+    for (i_, operators__) in coarities_.items():
+        for minimizes_ in operators__.values():
+            for (minimize__, objectives_) in minimizes_.items():
+                objectives_['pareto'] = frontiers(
+                    (objectives_['size'], objectives_['depth']), i, i_, minimize__
+                )
+
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,157 @@
+"""
+Generator of tables of circuits that have minimal depth. The tables of
+depth-optimal circuits that are included in the data set were produced
+using this module, and any of them can be reproduced as shown below.
+
+>>> from circuitdb.core import _db
+>>> ops = frozenset({logical.id_, logical.not_, logical.and_, logical.xor_})
+>>> depth(2, 1, ops, {logical.and_}) == _db[2][1][ops][frozenset({logical.and_})]['depth']
+True
+"""
+from __future__ import annotations
+from typing import AbstractSet
+import doctest
+import heapq
+import itertools
+import logical
+from circuitdb.core import records, _codes, _apply
+
+def depth( # pylint: disable=too-many-locals
+        arity: int,
+        coarity: int,
+        operators: AbstractSet[logical.logical],
+        minimize: AbstractSet[logical.logical]
+    ) -> records:
+    """
+    Build a table that contains a circuit of minimal depth for each function
+    having the supplied arity and coarity, where circuits only use gates from
+    ``operators`` and only gates from ``minimize`` contribute to the depth of
+    a circuit. Among the circuits of minimal depth for a function, circuits
+    that have fewer gates from ``minimize`` (and then fewer gates overall) are
+    preferred, but the chosen circuit is not guaranteed to be the smallest
+    circuit of minimal depth.
+
+    >>> from circuitdb.core import circuitview
+    >>> rs = depth(3, 1, logical.every, logical.every)
+    >>> v = circuitview(list.__getitem__(rs, 0b00000001), 3, 1)
+    >>> v.to_legible()
+    (('id',), ('id',), ('id',), ('and', 0, 1), ('and', 2, 3), ('id', 4))
+    >>> v.depth()
+    2
+    >>> circuitview(list.__getitem__(rs, 0b00010111), 3, 1).depth()
+    3
+
+    Tables for functions having multiple outputs are also supported, as are
+    tables for functions having no inputs.
+
+    >>> rs = depth(2, 2, logical.every, logical.every)
+    >>> circuitview(list.__getitem__(rs, 0b00011011), 2, 2).to_legible()
+    (('id',), ('id',), ('id', 0), ('id', 1))
+    >>> [circuitview(r, 0, 1).to_legible() for r in depth(0, 1, logical.every, logical.every)]
+    [(('nf',), ('id', 0)), (('nt',), ('id', 0))]
+
+    A table cannot be built if the supplied operators cannot be used to
+    implement every function.
+
+    >>> depth(2, 1, {logical.id_, logical.and_}, {logical.and_})
+    Traceback (most recent call last):
+      ...
+    ValueError: operators cannot be used to implement every function of arity 2
+    """
+    length = 2 ** arity
+    full = (1 << length) - 1
+    variables = [
+        sum(1 << (length - 1 - r) for r in range(length) if (r >> (arity - 1 - i)) & 1)
+        for i in range(arity)
+    ]
+    weights = {operator: int(operator in minimize) for operator in operators}
+    (unary, binary) = (
+        [o for o in sorted(logical.every) if o in operators and o.arity() == k and o != logical.id_]
+        for k in (1, 2)
+    )
+
+    # Determine a circuit of minimal depth for every function that has one
+    # output in the manner of Dijkstra's algorithm (which is possible because
+    # the depth of a gate is never less than the depths of its inputs). The
+    # circuit for a function is represented by the set of functions that its
+    # gates compute. Each function is always computed in the same way, so these
+    # sets can be merged to obtain circuits that share gates.
+    (definitions, depths, nodes, counted) = ({}, {}, {}, set())
+    (heap, keys, counter) = ([], {}, itertools.count())
+
+    def push(mask, operator, fanins):
+        if mask in depths:
+            return
+
+        depth_ = max((depths[f] for f in fanins), default=0) + weights[operator]
+        if mask in keys and depth_ > keys[mask][0]:
+            return
+
+        union = frozenset().union(*(nodes[f] for f in fanins))
+        key = (
+            depth_,
+            len(union & counted) + weights[operator],
+            len(union) + 1
+        )
+        if mask not in keys or key < keys[mask]:
+            keys[mask] = key
+            heapq.heappush(heap, key + (next(counter), mask, operator, fanins))
+
+    def finalize(mask, depth_, operator, fanins):
+        definitions[mask] = (operator, fanins)
+        depths[mask] = depth_
+        nodes[mask] = frozenset().union(*(nodes[f] for f in fanins)) | (
+            frozenset() if operator is None else frozenset([mask])
+        )
+        if operator in minimize:
+            counted.add(mask)
+
+        for operator_ in unary:
+            push(_apply(operator_, [mask], full), operator_, (mask,))
+        for other in list(depths):
+            for operator_ in binary:
+                push(_apply(operator_, [other, mask], full), operator_, (other, mask))
+                push(_apply(operator_, [mask, other], full), operator_, (mask, other))
+
+    for mask in variables:
+        finalize(mask, 0, None, ())
+
+    # Gates that have no inputs are considered only after gates that have
+    # inputs so that the latter are preferred when they are equivalent
+    # (consistent with the tables of circuits of minimal size).
+    for operator in sorted(logical.every):
+        if operator in operators and operator.arity() == 0:
+            push(_apply(operator, [], full), operator, ())
+
+    while len(heap) > 0:
+        (depth_, _, _, _, mask, operator, fanins) = heapq.heappop(heap)
+        if mask not in depths:
+            finalize(mask, depth_, operator, fanins)
+
+    if len(depths) < 2 ** length:
+        raise ValueError(
+            'operators cannot be used to implement every function of arity ' + str(arity)
+        )
+
+    # Encode a circuit for every function by merging the circuits of its outputs.
+    order = {mask: j for (j, mask) in enumerate(depths)}
+    rs = records()
+    for index in range(2 ** (length * coarity)):
+        bits = format(index, '0' + str(length * coarity) + 'b')
+        outputs = [int(bits[j::coarity], 2) for j in range(coarity)]
+        gates = sorted(frozenset().union(*(nodes[mask] for mask in outputs)), key=order.get)
+
+        positions = {mask: i for (i, mask) in enumerate(variables)}
+        positions.update({mask: arity + j for (j, mask) in enumerate(gates)})
+        bs = []
+        for mask in gates:
+            (operator, fanins) = definitions[mask]
+            bs.extend([_codes[operator]] + [positions[f] for f in fanins])
+        for mask in outputs:
+            bs.extend([_codes[logical.id_], positions[mask]])
+        rs.append(bytes(bs))
+
+    return rs
+
+if __name__ == '__main__':
+    doctest.testmod() # pragma: no cover
@@ -0,0 +1,355 @@
+"""
+Cut-based technology mapping engine that uses the data set as its library of
+cells (*i.e.*, that replaces small subcircuits of a larger circuit with optimal
+circuits from the data set).
+"""
+from __future__ import annotations
+from typing import Tuple, Sequence, Optional, AbstractSet
+import doctest
+import logical
+import circuit
+from circuitdb.core import circuitview, _db, _apply
+from circuitdb.circuitdb import circuitdb
+
+class _network: # pylint: disable=invalid-name,too-many-instance-attributes
+    """
+    Structurally hashed network of gates that supports incremental enumeration
+    of cuts and in-place replacement of the fanout-free cones of its gates.
+    Gate inputs always precede the gates that consume them, and references
+    of gates that will be used by gates which have not been added yet are
+    tracked so that the cones that a replacement removes are known exactly.
+    """
+    def __init__(self: _network, arity: int, k: int, limit: int):
+        self.k = k
+        self.limit = limit
+        self.operators = [logical.id_] * arity
+        self.fanins = [()] * arity
+        self.references = [0] * arity
+        self.cuts = [[(i,)] for i in range(arity)]
+        self.hashes = {}
+        self.arity = arity
+
+    def node(
+            self: _network,
+            operator: logical.logical,
+            fanins: Tuple[int, ...]
+        ) -> Tuple[int, bool]:
+        """
+        Find or add a gate and return its index (and whether it was added).
+        Identity gates are never added.
+        """
+        if operator == logical.id_:
+            return (fanins[0], False)
+
+        key = (operator, fanins)
+        if key in self.hashes:
+            return (self.hashes[key], False)
+
+        index = len(self.operators)
+        self.operators.append(operator)
+        self.fanins.append(fanins)
+        self.references.append(0)
+        self.hashes[key] = index
+
+        # Merge the cuts of the inputs, keeping the smallest cuts.
+        cuts = {()}
+        for fanin in fanins:
+            cuts = {
+                union
+                for cut in cuts
+                for cut_ in self.cuts[fanin]
+                for union in [tuple(sorted(set(cut).union(cut_)))]
+                if len(union) <= self.k
+            }
+        self.cuts.append(sorted(cuts, key=lambda cut: (len(cut), cut))[:self.limit])
+        self.cuts[index].append((index,))
+
+        return (index, True)
+
+    def cost(
+            self: _network,
+            nodes: Sequence[int],
+            minimize: AbstractSet[logical.logical]
+        ) -> Tuple[int, int]:
+        """
+        Cost of a collection of gates (ordered first by the number of gates
+        that are being minimized and then by the total number of gates).
+        """
+        return (sum(1 for i in nodes if self.operators[i] in minimize), len(nodes))
+
+    def function(self: _network, index: int, cut: Tuple[int, ...]) -> int:
+        """
+        Compute the truth table of a gate with respect to the leaves of one of its
+        cuts (packed in the same way as the indices of the data set).
+        """
+        full = (1 << (2 ** len(cut))) - 1
+        masks = {
+            leaf: sum(
+                1 << (2 ** len(cut) - 1 - row)
+                for row in range(2 ** len(cut))
+                if (row >> (len(cut) - 1 - j)) & 1
+            )
+            for (j, leaf) in enumerate(cut)
+        }
+
+        def mask(i: int) -> int:
+            if i not in masks:
+                masks[i] = _apply(self.operators[i], [mask(f) for f in self.fanins[i]], full)
+            return masks[i]
+
+        return mask(index)
+
+    def cone(self: _network, index: int, cut: Tuple[int, ...]) -> Sequence[int]:
+        """
+        Determine the gates that would no longer be referenced if the specified
+        gate were removed (stopping at the leaves of the supplied cut).
+        """
+        (removed, stack) = ([index], [index])
+        while stack:
+            for fanin in self.fanins[stack.pop()]:
+                self.references[fanin] -= 1
+                if self.references[fanin] == 0 and fanin not in cut and fanin >= self.arity:
+                    removed.append(fanin)
+                    stack.append(fanin)
+
+        # Restore the references.
+        for i in removed:
+            for fanin in self.fanins[i]:
+                self.references[fanin] += 1
+
+        return removed
+
+    def remove(self: _network, index: int):
+        """
+        Remove a gate that is no longer referenced, along with any of its inputs
+        that are no longer referenced as a result.
+        """
+        stack = [index]
+        while stack:
+            i = stack.pop()
+            if self.hashes.get((self.operators[i], self.fanins[i])) == i:
+                del self.hashes[(self.operators[i], self.fanins[i])]
+            for fanin in self.fanins[i]:
+                self.references[fanin] -= 1
+                if self.references[fanin] == 0 and fanin >= self.arity:
+                    stack.append(fanin)
+
+def rewrite( # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        c: circuit.circuit,
+        operators: Optional[AbstractSet[logical.logical]] = None,
+        minimize: Optional[AbstractSet[logical.logical]] = None,
+        k: int = 3,
+        limit: int = 8
+    ) -> circuit.circuit:
+    """
+    Construct a circuit that is equivalent to the supplied circuit by replacing
+    subcircuits with smaller circuits from the data set.
+
+    :param c: Circuit to rewrite.
+    :param operators: Set of operators that replacement circuits may use.
+    :param minimize: Set of operators the number of which should be minimized.
+    :param k: Maximum number of inputs of a replaced subcircuit.
+    :param limit: Maximum number of cuts retained for each gate.
+
+    Every gate (in topological order) is considered as the root of a subcircuit
+    that has at most ``k`` inputs (*i.e.*, a *k*-feasible cut). The truth table
+    of every cut is computed using bitwise operations and the optimal circuit for
+    that truth table is retrieved from the data set. Among the cuts for which
+    the retrieved circuit is smaller than the gates that it makes redundant, the
+    one that saves the most gates is applied. Gates are added to the rewritten
+    circuit one at a time and the cuts of each gate are derived from the cuts
+    of its inputs (so the cuts of a gate are computed once).
+
+    >>> c = circuit.circuit()
+    >>> g0 = c.gate(logical.id_, is_input=True)
+    >>> g1 = c.gate(logical.id_, is_input=True)
+    >>> g2 = c.gate(logical.not_, [g0])
+    >>> g3 = c.gate(logical.not_, [g1])
+    >>> g4 = c.gate(logical.and_, [g0, g3])
+    >>> g5 = c.gate(logical.and_, [g2, g1])
+    >>> g6 = c.gate(logical.or_, [g4, g5])
+    >>> g7 = c.gate(logical.id_, [g6], is_output=True)
+    >>> rewrite(c).gates.to_legible()
+    (('id',), ('id',), ('xor', 0, 1), ('id', 2))
+
+    The operators that the replacement circuits may use (and the operators the
+    number of which is minimized) can be specified.
+
+    >>> rewrite(c, {logical.id_, logical.not_, logical.and_, logical.or_}).count()
+    7
+    >>> rewrite(c, {logical.id_, logical.not_, logical.and_, logical.xor_}, {logical.and_})\\
+    ...     .gates.to_legible()
+    (('id',), ('id',), ('xor', 0, 1), ('id', 2))
+
+    Constant gates and identity gates are handled, and gates from which no output
+    can be reached are removed.
+
+    >>> c = circuit.circuit()
+    >>> g0 = c.gate(logical.id_, is_input=True)
+    >>> g1 = c.gate(logical.id_, is_input=True)
+    >>> g2 = c.gate(logical.nt_)
+    >>> g3 = c.gate(logical.and_, [g0, g2])
+    >>> g4 = c.gate(logical.not_, [g1])
+    >>> g5 = c.gate(logical.id_, [g4])
+    >>> g6 = c.gate(logical.id_, [g3], is_output=True)
+    >>> rewrite(c, {logical.id_, logical.not_, logical.and_, logical.or_}).gates.to_legible()
+    (('id',), ('id',), ('id', 0))
+
+    Larger circuits can be rewritten, as well.
+
+    >>> import random
+    >>> from itertools import product
+    >>> random.seed(0)
+    >>> c = circuit.circuit()
+    >>> gs = [c.gate(logical.id_, is_input=True) for _ in range(6)]
+    >>> ops = [logical.and_, logical.or_, logical.xor_, logical.nand_, logical.not_]
+    >>> for _ in range(200):
+    ...     op = random.choice(ops)
+    ...     gs.append(c.gate(op, random.sample(gs[-12:], op.arity())))
+    >>> os = [c.gate(logical.id_, [g], is_output=True) for g in gs[-3:]]
+    >>> r = rewrite(c)
+    >>> r.count() < c.count()
+    True
+    >>> all(
+    ...     list(r.evaluate(list(bs))) == list(c.evaluate(list(bs)))
+    ...     for bs in product(*[[0, 1]] * 6)
+    ... )
+    True
+
+    The cut size cannot exceed the largest arity for which data is available.
+
+    >>> rewrite(c, k=5)
+    Traceback (most recent call last):
+      ...
+    ValueError: cut size must be a positive integer no greater than 3
+    """
+    # Ensure the cut size is supported by the data set.
+    arities = [a for (a, coarities) in _db.items() if a > 0 and 1 in coarities]
+    if not isinstance(k, int) or not 1 <= k <= max(arities):
+        raise ValueError(
+            'cut size must be a positive integer no greater than ' + str(max(arities))
+        )
+
+    # Determine the tables from which replacements can be retrieved.
+    (_, _, operators, minimize, _) = circuitdb._key( # pylint: disable=protected-access
+        k, 1, operators, minimize
+    )
+    tables = {}
+    for arity in range(0, k + 1):
+        try:
+            key = circuitdb._key(arity, 1, operators, minimize) # pylint: disable=protected-access
+        except ValueError:
+            continue # No table exists (or can be derived) for this arity.
+        tables[arity] = circuitdb._table(key) # pylint: disable=protected-access
+
+    # Number each gate and count the references to each gate.
+    positions = {id(g): i for (i, g) in enumerate(c.gates)}
+    references = [0] * len(c.gates)
+    for g in c.gates:
+        for g_in in g.inputs:
+            references[positions[id(g_in)]] += 1
+
+    inputs = [g for g in c.gates if g.is_input]
+    network = _network(len(inputs), k, limit)
+    images = {id(g): i for (i, g) in enumerate(inputs)}
+    for g in inputs:
+        network.references[images[id(g)]] = references[positions[id(g)]]
+
+    # Replacement circuits retrieved from the data set (along with their cost).
+    replacements = {}
+
+    for g in c.gates:
+        if g.is_input or g.is_output:
+            continue
+
+        fanins = tuple(images[id(g_in)] for g_in in g.inputs)
+        (index, added) = network.node(g.operation, fanins)
+        images[id(g)] = index
+
+        # Transfer references that will be made to this gate.
+        network.references[index] += references[positions[id(g)]]
+        if not added:
+            # References to the inputs that this gate would have made.
+            for fanin in fanins:
+                network.references[fanin] -= 1
+                if network.references[fanin] == 0 and fanin >= network.arity:
+                    network.remove(fanin)
+            continue
+
+        # Find the cut for which the replacement offers the largest savings.
+        (best, best_cut, best_key) = ((0, 0), None, None)
+        for cut in network.cuts[index][:-1]:
+            if len(cut) not in tables:
+                continue
+
+            key = (len(cut), network.function(index, cut))
+            if key not in replacements:
+                v = circuitview(list.__getitem__(tables[key[0]], key[1]), key[0], 1)
+                replacements[key] = v.gates[key[0]:]
+
+            removed = set(network.cone(index, cut))
+
+            # Determine which replacement gates already exist (without adding any).
+            (placeholders, nodes) = (list(cut), [])
+            for (operator, inputs_) in replacements[key][:-1]:
+                fanins_ = tuple(placeholders[j] for j in inputs_)
+                existing = (
+                    fanins_[0]
+                    if operator == logical.id_ else
+                    network.hashes.get((operator, fanins_))
+                )
+                if existing is None or existing in removed:
+                    existing = -len(nodes) - 1
+                    nodes.append(operator)
+                placeholders.append(existing)
+
+            saved = tuple(
+                old - new
+                for (old, new) in zip(
+                    network.cost(removed, minimize),
+                    (sum(1 for o in nodes if o in minimize), len(nodes))
+                )
+            )
+            if saved > best:
+                (best, best_cut, best_key) = (saved, cut, key)
+
+        if best_cut is not None:
+            # The replacement must not be merged with the gate it replaces.
+            del network.hashes[(network.operators[index], network.fanins[index])]
+
+            (cut, key) = (best_cut, best_key)
+            placeholders = list(cut)
+            for (operator, inputs_) in replacements[key][:-1]:
+                fanins_ = tuple(placeholders[j] for j in inputs_)
+                (index_, added_) = network.node(operator, fanins_)
+                if added_:
+                    for fanin in fanins_:
+                        network.references[fanin] += 1
+                placeholders.append(index_)
+
+            # Redirect all references to the replacement and remove the old gate.
+            root = placeholders[replacements[key][-1][1][0]]
+            network.references[root] += network.references[index]
+            network.references[index] = 0
+            network.remove(index)
+            images[id(g)] = root
+
+    # Build the rewritten circuit from the gates that are reachable from the outputs.
+    outputs = [images[id(g.inputs[0])] for g in c.gates if g.is_output]
+    reachable = set(outputs)
+    for i in range(len(network.operators) - 1, network.arity - 1, -1):
+        if i in reachable:
+            reachable.update(network.fanins[i])
+
+    r = circuit.circuit()
+    gs = {i: r.gate(logical.id_, is_input=True) for i in range(network.arity)}
+    for i in sorted(reachable):
+        if i >= network.arity:
+            gs[i] = r.gate(network.operators[i], [gs[j] for j in network.fanins[i]])
+    for i in outputs:
+        r.gate(logical.id_, [gs[i]], is_output=True)
+
+    return r
+
+if __name__ == '__main__':
+    doctest.testmod() # pragma: no cover
@@ -0,0 +1,402 @@
+"""
+Translation engine that derives tables of circuits for operator sets that
+are not included in the data set. Each circuit in the data set is translated
+into the requested operator set by replacing each of its gates with a smallest
+(or shallowest) circuit for the corresponding operator, the result is simplified,
+and the best translation of any circuit for a function is retained. Derived
+circuits are *not* guaranteed to be optimal.
+
+>>> nand = frozenset({logical.nand_})
+>>> rs = derive(2, 1, nand, nand)['size']
+>>> rs.optimal
+False
+>>> circuitview(list.__getitem__(rs, 0b0110), 2, 1).to_legible()
+(('id',), ('id',), ('nand', 0, 1), ('nand', 0, 2), ('nand', 1, 2), ('nand', 3, 4), ('id', 5))
+"""
+from __future__ import annotations
+from typing import Tuple, List, Dict, AbstractSet
+import doctest
+import heapq
+import itertools
+import logical
+from circuitdb.core import \
+    records, frontiers, circuitview, cache, _db, _codes, _apply, _name
+from circuitdb.generate import depth
+
+_derived: dict = {}
+"""
+Private dictionary object that caches derived tables (which are built lazily).
+"""
+
+_version: int = 2 # pylint: disable=invalid-name
+"""
+Private version of the translation algorithm (with which derived tables are
+stored in the persistent :obj:`~circuitdb.core.cache`). It must be incremented
+whenever the derived tables change.
+"""
+
+def _variables(arity: int) -> List[int]:
+    """
+    Return the bit vectors that represent the values of the inputs across all
+    rows of a truth table for functions having the supplied arity.
+
+    >>> [bin(mask) for mask in _variables(2)]
+    ['0b11', '0b101']
+    """
+    length = 2 ** arity
+    return [
+        sum(1 << (length - 1 - r) for r in range(length) if (r >> (arity - 1 - i)) & 1)
+        for i in range(arity)
+    ]
+
+def _encode(
+        arity: int,
+        gates: Tuple[Tuple[logical.logical, Tuple[int, ...]], ...],
+        outputs: Tuple[int, ...]
+    ) -> bytes:
+    """
+    Encode a circuit (given the operator and the input gate indices of each of
+    its non-input gates and the indices of the gates that are outputs), omitting
+    any gates on which no output depends.
+
+    >>> _encode(1, ((logical.not_, (0,)), (logical.not_, (0,))), (2,)).hex()
+    '0c000601'
+    """
+    # Determine which gates are used, starting from the outputs.
+    used = set(outputs)
+    for index in reversed(range(arity, arity + len(gates))):
+        if index in used:
+            used.update(gates[index - arity][1])
+
+    (positions, bs) = ({k: k for k in range(arity)}, [])
+    for (index, (operator, inputs)) in enumerate(gates, arity):
+        if index in used:
+            bs.extend([_codes[operator]] + [positions[k] for k in inputs])
+            positions[index] = len(positions)
+    for k in outputs:
+        bs.extend([_codes[logical.id_], positions[k]])
+
+    return bytes(bs)
+
+def _smallest( # pylint: disable=too-many-locals
+        arity: int,
+        operators: AbstractSet[logical.logical],
+        minimize: AbstractSet[logical.logical]
+    ) -> records:
+    """
+    Build a table that contains a circuit of minimal size for each function
+    having the supplied arity and one output by exhaustively searching the
+    collections of functions that can be computed by circuits of increasing
+    size (which is only feasible for very low arities).
+
+    >>> rs = _smallest(2, {logical.nor_}, {logical.nor_})
+    >>> circuitview(list.__getitem__(rs, 0b0001), 2, 1).to_legible()
+    (('id',), ('id',), ('nor', 0, 0), ('nor', 1, 1), ('nor', 2, 3), ('id', 4))
+    >>> _smallest(2, {logical.and_, logical.or_}, {logical.and_, logical.or_})
+    Traceback (most recent call last):
+      ...
+    ValueError: operators cannot be used to implement every function of arity 2
+    """
+    length = 2 ** arity
+    full = (1 << length) - 1
+    variables = tuple(_variables(arity))
+    operators = [o for o in sorted(logical.every) if o in operators and o != logical.id_]
+
+    # Because every gate contributes to the cost of a collection, the first
+    # collection that contains a function corresponds to a smallest circuit.
+    (found, seen, counter) = ({}, set(), itertools.count())
+    heap = [((0, 0), next(counter), variables, ())]
+    while len(heap) > 0 and len(found) < 2 ** length:
+        (cost, _, masks, gates) = heapq.heappop(heap)
+        if frozenset(masks) in seen:
+            continue
+        seen.add(frozenset(masks))
+
+        for (index, mask) in enumerate(masks):
+            found.setdefault(mask, (gates, index))
+
+        for operator in operators:
+            for inputs in itertools.product(range(len(masks)), repeat=operator.arity()):
+                mask = _apply(operator, [masks[k] for k in inputs], full)
+                if mask not in masks and frozenset(masks + (mask,)) not in seen:
+                    heapq.heappush(heap, (
+                        (cost[0] + (operator in minimize), cost[1] + 1),
+                        next(counter),
+                        masks + (mask,),
+                        gates + ((operator, inputs),)
+                    ))
+
+    if len(found) < 2 ** length:
+        raise ValueError(
+            'operators cannot be used to implement every function of arity ' + str(arity)
+        )
+
+    return records(
+        _encode(arity, found[mask][0], (found[mask][1],))
+        for mask in range(2 ** length)
+    )
+
+def _translate( # pylint: disable=too-many-locals
+        view: circuitview,
+        rules: Dict[int, records]
+    ) -> bytes:
+    """
+    Translate a circuit by replacing each of its gates with the circuit for the
+    corresponding operator (from the supplied tables of circuits for functions
+    having no inputs and for functions having two inputs). Gates that compute
+    the same function as an existing gate are not added.
+
+    >>> ops = frozenset({logical.id_, logical.not_, logical.and_, logical.or_})
+    >>> view = circuitview(list.__getitem__(_db[2][1][ops][ops]['size'], 0b1001), 2, 1)
+    >>> nand = {logical.nand_}
+    >>> rules = {2: _smallest(2, nand, nand)}
+    >>> circuitview(_translate(view, rules), 2, 1).count()
+    5
+    """
+    (arity, coarity) = (view.arity, view.coarity)
+    full = (1 << (2 ** arity)) - 1
+    masks = _variables(arity)
+    hashes = {mask: index for (index, mask) in enumerate(masks)}
+    gates = []
+
+    positions = list(range(arity))
+    for (operator, inputs) in view.gates[arity:len(view) - coarity]:
+        # Retrieve the circuit for the operator (viewing an operator that has
+        # fewer than two inputs as a binary operator that ignores its inputs
+        # unless the circuit has no inputs, in which case every gate computes
+        # a constant and is replaced with the circuit for that constant).
+        if arity == 0:
+            constant = _apply(operator, [masks[positions[k]] for k in inputs], full)
+            (rule, inputs) = (circuitview(list.__getitem__(rules[0], constant), 0, 1), ())
+        else:
+            bits = ''.join(str(operator[r >> (2 - operator.arity())]) for r in range(4))
+            rule = circuitview(list.__getitem__(rules[2], int(bits, 2)), 2, 1)
+            inputs = inputs if len(inputs) > 0 else (0,)
+
+        mapping = [positions[k] for k in inputs[:1] + inputs[-1:]][:rule.arity]
+        for (operator_, inputs_) in rule.gates[rule.arity:-1]:
+            mask = _apply(operator_, [masks[mapping[k]] for k in inputs_], full)
+            if mask not in hashes:
+                hashes[mask] = len(masks)
+                masks.append(mask)
+                gates.append((operator_, tuple(mapping[k] for k in inputs_)))
+            mapping.append(hashes[mask])
+        positions.append(mapping[rule[-1][1][0]])
+
+    return _encode(
+        arity,
+        tuple(gates),
+        tuple(positions[inputs[0]] for (_, inputs) in view.gates[len(view) - coarity:])
+    )
+
+def _peephole( # pylint: disable=too-many-locals,too-many-branches
+        view: circuitview,
+        rules: records,
+        minimize: AbstractSet[logical.logical]
+    ) -> bytes:
+    """
+    Simplify a circuit by repeatedly replacing a gate (together with the gates
+    on which only that gate depends) with the circuit from the supplied table
+    for the function that the gate computes in terms of two other gates, as
+    long as doing so reduces the number of gates.
+
+    >>> nor = frozenset({logical.nor_})
+    >>> record_ = _encode(2, (
+    ...     (logical.nor_, (0, 1)), (logical.nor_, (2, 2)), (logical.nor_, (3, 3))
+    ... ), (4,))
+    >>> v = circuitview(_peephole(circuitview(record_, 2, 1), _smallest(2, nor, nor), nor), 2, 1)
+    >>> v.to_legible()
+    (('id',), ('id',), ('nor', 0, 1), ('id', 2))
+    """
+    (arity, coarity) = (view.arity, view.coarity)
+    full = (1 << (2 ** arity)) - 1
+    while True:
+        gates = view.gates
+        masks = _variables(arity)
+        references = [0] * len(gates)
+        for (operator, inputs) in gates[arity:]:
+            masks.append(_apply(operator, [masks[k] for k in inputs], full))
+            for k in inputs:
+                references[k] += 1
+
+        replacement = None
+        for index in range(arity, len(gates) - coarity):
+            # Determine the gates that can be removed if this gate is replaced.
+            (counts, cone, stack) = (list(references), {index}, [index])
+            while len(stack) > 0:
+                for k in gates[stack.pop()][1]:
+                    counts[k] -= 1
+                    if counts[k] == 0 and k >= arity:
+                        cone.add(k)
+                        stack.append(k)
+            cost = (sum(gates[k][0] in minimize for k in cone), len(cone))
+
+            # Find two other gates in terms of which this gate can be computed
+            # using a smaller circuit.
+            for (i, j) in itertools.combinations([k for k in range(index) if k not in cone], 2):
+                bits = 0
+                for row in range(4):
+                    rows = (masks[i] if row & 2 else full ^ masks[i]) & \
+                        (masks[j] if row & 1 else full ^ masks[j])
+                    if masks[index] & rows not in (0, rows):
+                        break
+                    bits |= int(masks[index] & rows != 0) << (3 - row)
+                else:
+                    rule = circuitview(list.__getitem__(rules, bits), 2, 1)
+                    if (rule.count(minimize), rule.count()) < cost:
+                        replacement = (index, i, j, rule)
+                        break
+            if replacement is not None:
+                break
+
+        if replacement is None:
+            return view.record
+
+        # Rebuild the circuit using the replacement (the unused gates are removed
+        # when the circuit is encoded).
+        (index, i, j, rule) = replacement
+        (gates_, positions) = ([], list(range(arity)))
+        for (k, (operator, inputs)) in enumerate(gates[arity:len(gates) - coarity], arity):
+            if k == index:
+                mapping = [positions[i], positions[j]]
+                for (operator_, inputs_) in rule.gates[2:-1]:
+                    gates_.append((operator_, tuple(mapping[m] for m in inputs_)))
+                    mapping.append(arity + len(gates_) - 1)
+                positions.append(mapping[rule[-1][1][0]])
+            else:
+                gates_.append((operator, tuple(positions[m] for m in inputs)))
+                positions.append(arity + len(gates_) - 1)
+
+        view = circuitview(
+            _encode(
+                arity,
+                tuple(gates_),
+                tuple(positions[inputs[0]] for (_, inputs) in gates[len(gates) - coarity:])
+            ),
+            arity, coarity
+        )
+
+def derive( # pylint: disable=too-many-locals
+        arity: int,
+        coarity: int,
+        operators: AbstractSet[logical.logical],
+        minimize: AbstractSet[logical.logical]
+    ) -> dict:
+    """
+    Derive the tables of circuits (for each objective) that have the supplied
+    arity and coarity, that are constructed using only the supplied operators,
+    and in which only gates corresponding to operators in ``minimize`` are
+    counted. Derived tables are built the first time they are requested and
+    are stored in the persistent :obj:`~circuitdb.core.cache`.
+
+    >>> nand = frozenset({logical.nand_})
+    >>> ts = derive(3, 1, nand, nand)
+    >>> [(v.count(), v.depth()) for v in ts['pareto'].view((0, 1, 1, 0, 1, 0, 0, 0))]
+    [(10, 6), (12, 5)]
+    >>> ts['pareto'].optimal
+    False
+    >>> derive(3, 1, nand, nand) is ts
+    True
+
+    Tables that are stored in the cache are not derived again.
+
+    >>> del _derived[(3, 1, nand, nand)]
+    >>> derive(3, 1, nand, nand)['depth'] == ts['depth']
+    True
+
+    Tables for functions having no inputs are derived in the same way.
+
+    >>> ops = {logical.nt_, logical.xor_}
+    >>> [circuitview(r, 0, 1).to_legible() for r in derive(0, 1, ops, ops)['size']]
+    [(('nt',), ('xor', 0, 0), ('id', 1)), (('nt',), ('id', 0))]
+
+    The value of each gate in such a circuit is determined by the values of its
+    inputs (rather than only by its operator), so every derived circuit computes
+    the constant for which it is retrieved.
+
+    >>> from circuitdb import circuitdb
+    >>> ops = [{logical.nt_, o} for o in (logical.xor_, logical.not_, logical.nand_)]
+    >>> all(
+    ...     circuitdb.equivalent(circuitview(r, 0, 1).to_circuit(), index)
+    ...     for ops_ in ops for objective in ('size', 'depth')
+    ...     for (index, r) in enumerate(derive(0, 1, ops_, ops_)[objective])
+    ... )
+    True
+
+    A table cannot be derived if the supplied operators cannot be used to
+    implement every function.
+
+    >>> derive(2, 1, {logical.xor_}, {logical.xor_})
+    Traceback (most recent call last):
+      ...
+    ValueError: operators cannot be used to implement every function of arity 2
+    """
+    (operators, minimize) = (frozenset(operators), frozenset(minimize))
+    key = (arity, coarity, operators, minimize)
+    if key in _derived:
+        return _derived[key]
+
+    (tables, sources) = ({}, None)
+    for objective in ('size', 'depth'):
+        # Use the table from the persistent cache if it is available.
+        name = 'derived_' + _name(arity, coarity, operators, minimize, objective)
+        data = cache.load(name, _version)
+        if data is not None:
+            tables[objective] = records.from_bytes(data)
+            tables[objective].optimal = False
+            continue
+
+        # The circuits in the data set and the circuits of minimal depth that
+        # are built using the operator set are the candidates for translation.
+        if sources is None:
+            sources = [
+                table
+                for minimizes in _db[arity][coarity].values()
+                for objectives in minimizes.values()
+                for table in (objectives['size'], objectives['depth'])
+            ] + [depth(arity, coarity, operators, minimize)]
+
+        # Translate every candidate for each function using the smallest (or the
+        # shallowest) circuit for each operator, keeping the best translation.
+        rules = (
+            {0: _smallest(0, operators, minimize)}
+            if arity == 0 else
+            {2: _smallest(2, operators, minimize)}
+            if objective == 'size' else
+            {2: depth(2, 1, operators, minimize)}
+        )
+
+        tables[objective] = records()
+        tables[objective].optimal = False
+        for index in range(len(sources[0])):
+            views = [
+                circuitview(
+                    _translate(circuitview(list.__getitem__(table, index), arity, coarity), rules),
+                    arity, coarity
+                )
+                for table in sources
+            ]
+            if objective == 'depth':
+                # The simplified circuit of minimal size may be no deeper.
+                views.append(circuitview(list.__getitem__(tables['size'], index), arity, coarity))
+
+            candidates = []
+            for v in views:
+                metrics = (v.count(minimize), v.count(), v.depth(minimize))
+                candidates.append((
+                    metrics if objective == 'size' else metrics[2:] + metrics[:2],
+                    v.record
+                ))
+            record_ = min(candidates)[1]
+            if objective == 'size' and arity > 0:
+                record_ = _peephole(circuitview(record_, arity, coarity), rules[2], minimize)
+            tables[objective].append(record_)
+
+        cache.store(name, tables[objective].to_bytes(), _version)
+
+    tables['pareto'] = frontiers((tables['size'], tables['depth']), arity, coarity, minimize)
+    _derived[key] = tables
+    return tables
+
+if __name__ == '__main__':
+    doctest.testmod() # pragma: no cover